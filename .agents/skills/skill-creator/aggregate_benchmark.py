@@ -3,11 +3,22 @@
 Aggregate individual run results into benchmark summary statistics.
 
 Reads grading.json files from run directories and produces:
-- run_summary with mean, stddev, min, max for each metric
-- delta between with_skill and without_skill configurations
+- run_summary with mean, stddev, min, max, p50, p90 for each metric
+- delta between each configuration and the baseline (with_skill vs
+  without_skill by default; any configuration directories, e.g. v0..vN,
+  are discovered and compared against --baseline)
+- optionally (--significance), bootstrap confidence intervals and
+  permutation-test p-values for each delta
+- eval_summary and expectation_summary with the same delta per eval_id
+  and per expectation text
 
 Usage:
-    python aggregate_benchmark.py <benchmark_dir>
+    python aggregate_benchmark.py <benchmark_dir> [--jobs N] [--no-cache]
+                                  [--format pretty|compact|ndjson]
+                                  [--significance [--resamples N] [--seed S]]
+                                  [--index <index.jsonl>]
+    python aggregate_benchmark.py <benchmarks_root> --reindex --index <index.jsonl>
+    python aggregate_benchmark.py --trend --index <index.jsonl> [--skill-name <name>]
 
 Example:
     python aggregate_benchmark.py benchmarks/2026-01-15T10-30-00/
@@ -24,200 +35,1081 @@ The script expects this directory structure:
                 ├── run-1/grading.json
                 ├── run-2/grading.json
                 └── run-3/grading.json
+
+Any other directory of run-* directories under eval-N (e.g. v0/, v1/) is
+treated as a configuration.
 """
 
 import argparse
+import hashlib
 import json
 import math
+import random
+import re
 import sys
+from array import array
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache, partial
 from pathlib import Path
 
+try:
+    import numpy as np
+except ImportError:  # Optional: significance testing falls back to pure Python
+    np = None
+
+try:
+    import tiktoken
+except ImportError:  # Optional: enables --tokenizer tiktoken
+    tiktoken = None
+
+# Concurrent grading.json readers used by load_run_results
+DEFAULT_JOBS = 8
+
+# Standard configurations, in reporting order. Others (e.g. v0..vN skill
+# versions) are discovered from the runs/ tree.
+DEFAULT_CONFIGURATIONS = ("with_skill", "without_skill")
+
+# Sidecar cache of extracted run results, relative to the benchmark directory.
+# Bump CACHE_VERSION whenever extract_run_result changes what it stores.
+CACHE_FILENAME = ".aggregate_cache"
+CACHE_VERSION = 3
+
+# Token accounting: execution_metrics keys holding a real token count (first
+# match wins), transcript locations within a run directory, and the sidecar
+# cache of transcript token counts keyed by tokenizer and content hash
+TOKEN_METRIC_KEYS = ("total_tokens", "tokens", "output_tokens")
+TRANSCRIPT_PATHS = ("transcript.md", "outputs/transcript.md")
+TOKEN_CACHE_FILENAME = ".token_cache"
+DEFAULT_TOKENIZER = "approx"
+# Words and individual punctuation marks, for count_tokens_approx
+TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+CHARS_PER_TOKEN = 4
+
+# Metrics summarized per configuration in run_summary
+SUMMARY_METRICS = ("pass_rate", "time_seconds", "tokens")
+# Percentiles reported alongside mean/stddev/min/max, and the number of
+# values a QuantileSketch level holds before compacting
+PERCENTILES = (50, 90)
+SKETCH_CAPACITY = 256
+
+# RunTable columns: integer fields in array("q"), float fields in array("d").
+# A column holding a value of another type (float tokens, integer seconds)
+# falls back to a list, so values are never converted.
+RUN_INT_COLUMNS = ("eval_id", "run_number", "passed", "failed", "total",
+                   "tool_calls", "tokens", "errors")
+RUN_FLOAT_COLUMNS = ("pass_rate", "time_seconds")
+COLUMN_TYPES = {"q": int, "d": float}
+EXPECTATION_FIELDS = {"text", "passed", "evidence"}
+
+# Encoders for write_benchmark_json, bound once rather than per run
+PRETTY_ENCODER = json.JSONEncoder(indent=2)
+COMPACT_ENCODER = json.JSONEncoder(separators=(",", ":"))
+OUTPUT_FORMATS = ("pretty", "compact", "ndjson")
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Bootstrap / permutation resamples for --significance, and the number of
+# resampled values NumPy materializes per batch (small enough that a
+# batch's draws stay in CPU cache between passes)
+DEFAULT_RESAMPLES = 10000
+CONFIDENCE_LEVEL = 0.95
+RESAMPLE_BATCH_VALUES = 1 << 16
+
+# Characters for trend sparklines, lowest to highest
+SPARK_CHARS = "▁▂▃▄▅▆▇█"
+
+# Rows shown in each benchmark.md breakdown table (full data is in benchmark.json)
+BREAKDOWN_ROWS = 10
+
+
+class QuantileSketch:
+    """
+    Bounded-memory quantile estimates (a simplified KLL compactor).
 
-def calculate_stats(values: list[float]) -> dict:
-    """Calculate mean, stddev, min, max for a list of values."""
-    if not values:
-        return {"mean": 0.0, "stddev": 0.0, "min": 0.0, "max": 0.0}
+    Values are kept exactly until a level holds more than `capacity` items.
+    That level is then sorted and every other item is promoted to the next
+    level with twice the weight, so memory grows with log(n / capacity)
+    and results are exact for up to `capacity` values.
+    """
 
-    n = len(values)
-    mean = sum(values) / n
+    __slots__ = ("capacity", "levels", "_offset")
+
+    def __init__(self, capacity: int = SKETCH_CAPACITY):
+        self.capacity = capacity
+        self.levels = [[]]
+        self._offset = 0
+
+    def add(self, value: float) -> None:
+        self.levels[0].append(value)
+
+        level = 0
+        while len(self.levels[level]) > self.capacity:
+            items = sorted(self.levels[level])
+            self.levels[level] = []
+            if level + 1 == len(self.levels):
+                self.levels.append([])
+            # Alternate which half survives so compaction error doesn't drift one way
+            self.levels[level + 1].extend(items[self._offset::2])
+            self._offset ^= 1
+            level += 1
+
+    def quantile(self, q: float) -> float:
+        """Return the nearest-rank q-quantile (0 <= q <= 1) of the values seen."""
+        weighted = sorted(
+            (value, 1 << level)
+            for level, items in enumerate(self.levels)
+            for value in items
+        )
+        if not weighted:
+            return 0.0
+
+        target = q * sum(weight for _, weight in weighted)
+        cumulative = 0
+        for value, weight in weighted:
+            cumulative += weight
+            if cumulative >= target:
+                return value
+        return weighted[-1][0]
+
+
+class RunningStats:
+    """Single-pass mean/stddev/min/max (Welford) plus sketched percentiles."""
+
+    __slots__ = ("count", "mean", "m2", "min", "max", "sketch")
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.sketch = QuantileSketch()
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        self.sketch.add(value)
+
+    @property
+    def stddev(self) -> float:
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+    def summary(self, zero: float = 0.0) -> dict:
+        """Return the stats dict used in run_summary (`zero` fills every field when empty)."""
+        if not self.count:
+            return {"mean": zero, "stddev": zero, "min": zero, "max": zero, "p50": zero, "p90": zero}
+
+        stats = {
+            "mean": round(self.mean, 4),
+            "stddev": round(self.stddev, 4),
+            "min": round(self.min, 4),
+            "max": round(self.max, 4)
+        }
+        for percentile in PERCENTILES:
+            stats[f"p{percentile}"] = round(self.sketch.quantile(percentile / 100), 4)
+        return stats
+
+
+def config_sort_key(config: str) -> tuple:
+    """Order configurations: with_skill, without_skill, then others naturally (v2 before v10)."""
+    if config in DEFAULT_CONFIGURATIONS:
+        return (DEFAULT_CONFIGURATIONS.index(config), ())
+    return (len(DEFAULT_CONFIGURATIONS), tuple(
+        (0, int(part), "") if part.isdigit() else (1, 0, part)
+        for part in re.split(r"(\d+)", config) if part
+    ))
 
-    if n > 1:
-        variance = sum((x - mean) ** 2 for x in values) / (n - 1)
-        stddev = math.sqrt(variance)
-    else:
-        stddev = 0.0
+
+def order_configurations(configurations) -> list[str]:
+    """
+    Sort discovered configurations for reporting.
+
+    A benchmark using only the standard configurations always reports both,
+    so a missing baseline shows up as zeros rather than disappearing.
+    """
+    configurations = set(configurations)
+    if configurations <= set(DEFAULT_CONFIGURATIONS):
+        return list(DEFAULT_CONFIGURATIONS)
+    return sorted(configurations, key=config_sort_key)
+
+
+def choose_baseline(configurations: list[str], requested: str | None = None) -> str:
+    """Pick the configuration deltas are measured against."""
+    if requested:
+        if requested not in configurations:
+            raise ValueError(
+                f"Baseline '{requested}' not found. Configurations: {', '.join(configurations)}"
+            )
+        return requested
+    if "without_skill" in configurations:
+        return "without_skill"
+    return configurations[0]
+
+
+def format_deltas(stats: dict, baseline_stats: dict) -> dict:
+    """Format the difference of means between two run_summary configurations."""
+    delta_pass_rate = stats.get("pass_rate", {}).get("mean", 0) - baseline_stats.get("pass_rate", {}).get("mean", 0)
+    delta_time = stats.get("time_seconds", {}).get("mean", 0) - baseline_stats.get("time_seconds", {}).get("mean", 0)
+    delta_tokens = stats.get("tokens", {}).get("mean", 0) - baseline_stats.get("tokens", {}).get("mean", 0)
 
     return {
-        "mean": round(mean, 4),
-        "stddev": round(stddev, 4),
-        "min": round(min(values), 4),
-        "max": round(max(values), 4)
+        "pass_rate": f"{delta_pass_rate:+.2f}",
+        "time_seconds": f"{delta_time:+.1f}",
+        "tokens": f"{delta_tokens:+.0f}"
     }
 
 
-def load_run_results(benchmark_dir: Path) -> dict:
+def add_deltas(entry: dict, comparisons: list[str], baseline: str, delta_of) -> dict:
     """
-    Load all run results from a benchmark directory.
+    Add `delta` (first compared configuration vs baseline) to a summary entry,
+    plus `deltas` keyed by configuration when there is more than one comparison.
+    """
+    deltas = {config: delta_of(entry[config], entry[baseline]) for config in comparisons}
+    entry["delta"] = deltas[comparisons[0]] if comparisons else delta_of(entry[baseline], entry[baseline])
+    if len(comparisons) > 1:
+        entry["deltas"] = deltas
+    return entry
 
-    Returns dict with structure:
-    {
-        "with_skill": [
-            {"eval_id": 1, "run_number": 1, "pass_rate": 0.85, ...},
-            ...
-        ],
-        "without_skill": [...]
+
+class RunSummary:
+    """
+    Streaming run_summary builder.
+
+    Feed each run with add() as it is loaded; run_summary() then produces
+    the per-configuration stats and deltas without holding the values.
+    Configurations are registered as their first run arrives; set
+    `configurations` and `baseline` (see choose_baseline) before reporting.
+    """
+
+    def __init__(self):
+        # config -> metric -> RunningStats
+        self.stats = {}
+        # eval_id -> config -> RunningStats of pass_rate
+        self.evals = {}
+        # expectation text -> {"eval_ids": set, config: [passed, total]}
+        self.expectations = {}
+        self.configurations = list(DEFAULT_CONFIGURATIONS)
+        self.baseline = "without_skill"
+
+    @property
+    def comparisons(self) -> list[str]:
+        return [config for config in self.configurations if config != self.baseline]
+
+    def add(self, config: str, result: dict) -> None:
+        config_stats = self.stats.get(config)
+        if config_stats is None:
+            config_stats = self.stats[config] = {metric: RunningStats() for metric in SUMMARY_METRICS}
+        for metric, stats in config_stats.items():
+            stats.add(result.get(metric, 0))
+
+        eval_stats = self.evals.setdefault(result["eval_id"], {})
+        if config not in eval_stats:
+            eval_stats[config] = RunningStats()
+        eval_stats[config].add(result.get("pass_rate", 0.0))
+
+        for expectation in result.get("expectations", []):
+            if not isinstance(expectation, dict):
+                continue  # kept verbatim in the run, but has no text or verdict to count
+            text = expectation.get("text") or ""
+            group = self.expectations.get(text)
+            if group is None:
+                group = self.expectations[text] = {"eval_ids": set()}
+            group["eval_ids"].add(result["eval_id"])
+            counts = group.get(config)
+            if counts is None:
+                counts = group[config] = [0, 0]
+            counts[0] += bool(expectation.get("passed"))
+            counts[1] += 1
+
+    def run_summary(self) -> dict:
+        """Return run_summary with stats for each configuration and deltas against the baseline."""
+        run_summary = {}
+
+        for config in self.configurations:
+            metrics = self.stats.get(config) or {metric: RunningStats() for metric in SUMMARY_METRICS}
+            run_summary[config] = {
+                "pass_rate": metrics["pass_rate"].summary(),
+                "time_seconds": metrics["time_seconds"].summary(),
+                "tokens": metrics["tokens"].summary(zero=0)
+            }
+
+        return add_deltas(run_summary, self.comparisons, self.baseline, format_deltas)
+
+    def eval_summary(self) -> list[dict]:
+        """Return pass-rate stats and deltas against the baseline for each eval, by eval_id."""
+        eval_summary = []
+
+        def delta_of(stats, baseline_stats):
+            delta = stats["pass_rate"]["mean"] - baseline_stats["pass_rate"]["mean"]
+            return {"pass_rate": f"{delta:+.2f}"}
+
+        for eval_id in sorted(self.evals):
+            eval_stats = self.evals[eval_id]
+            entry = {"eval_id": eval_id}
+            for config in self.configurations:
+                stats = eval_stats.get(config) or RunningStats()
+                entry[config] = {"runs": stats.count, "pass_rate": stats.summary()}
+            eval_summary.append(add_deltas(entry, self.comparisons, self.baseline, delta_of))
+
+        return eval_summary
+
+    def expectation_summary(self) -> list[dict]:
+        """Return pass counts and deltas against the baseline for each distinct expectation text."""
+        expectation_summary = []
+
+        def delta_of(counts, baseline_counts):
+            return {"pass_rate": f"{counts['pass_rate'] - baseline_counts['pass_rate']:+.2f}"}
+
+        for text, group in self.expectations.items():
+            entry = {"text": text, "eval_ids": sorted(group["eval_ids"])}
+            for config in self.configurations:
+                passed, total = group.get(config, (0, 0))
+                entry[config] = {
+                    "passed": passed,
+                    "total": total,
+                    "pass_rate": round(passed / total, 4) if total else 0.0
+                }
+            expectation_summary.append(add_deltas(entry, self.comparisons, self.baseline, delta_of))
+
+        return expectation_summary
+
+
+def calculate_stats(values: list[float]) -> dict:
+    """Calculate mean, stddev, min, max and percentiles for a list of values."""
+    stats = RunningStats()
+    for value in values:
+        stats.add(value)
+    return stats.summary()
+
+
+def resample_mean_diffs_numpy(a: list, b: list, resamples: int, seed: int) -> tuple[list, list]:
+    """
+    Bootstrap and permutation mean differences, vectorized with NumPy.
+
+    a and b hold one value sequence per metric. Each resample is drawn once
+    and applied to every metric: bootstrap draws become per-run counts and
+    permutations become group-membership masks, so all metric means come
+    out of one matrix product per batch.
+
+    Batches are kept small (RESAMPLE_BATCH_VALUES) so the draws stay in
+    cache; run time is then dominated by generating the random draws.
+
+    Returns (boot_diffs, perm_diffs), each a list of resamples per metric.
+    """
+    rng = np.random.default_rng(seed)
+    a = np.column_stack([np.asarray(column, dtype=float) for column in a])
+    b = np.column_stack([np.asarray(column, dtype=float) for column in b])
+    pooled = np.concatenate([a, b])
+    n_a, n_b, n = len(a), len(b), len(pooled)
+    total = pooled.sum(axis=0)
+    batch = max(1, RESAMPLE_BATCH_VALUES // n)
+
+    def bootstrap_means(values, size):
+        m = len(values)
+        draws = rng.integers(0, m, size=(size, m), dtype=np.int32)
+        draws += np.arange(0, size * m, m, dtype=np.int32)[:, None]
+        counts = np.bincount(draws.ravel(), minlength=size * m).reshape(size, m)
+        return counts @ values / m
+
+    boot_diffs = []
+    perm_diffs = []
+    for start in range(0, resamples, batch):
+        size = min(batch, resamples - start)
+        boot_diffs.append(bootstrap_means(a, size) - bootstrap_means(b, size))
+
+        # The n_a smallest random keys in each row pick group a of a permutation
+        keys = rng.random((size, n))
+        kth = np.partition(keys, n_a - 1, axis=1)[:, n_a - 1:n_a]
+        sums_a = (keys <= kth) @ pooled
+        perm_diffs.append(sums_a / n_a - (total - sums_a) / n_b)
+
+    return np.concatenate(boot_diffs).T.tolist(), np.concatenate(perm_diffs).T.tolist()
+
+
+def resample_mean_diffs_python(a: list, b: list, resamples: int, seed: int) -> tuple[list, list]:
+    """Pure-Python equivalent of resample_mean_diffs_numpy, for when NumPy is missing."""
+    rng = random.Random(seed)
+    a = [list(column) for column in a]
+    b = [list(column) for column in b]
+    pooled = [column_a + column_b for column_a, column_b in zip(a, b)]
+    n_a, n_b = len(a[0]), len(b[0])
+    rows_a, rows_b, rows = range(n_a), range(n_b), list(range(n_a + n_b))
+
+    boot_diffs = [[] for _ in a]
+    perm_diffs = [[] for _ in a]
+    for _ in range(resamples):
+        draw_a = rng.choices(rows_a, k=n_a)
+        draw_b = rng.choices(rows_b, k=n_b)
+        rng.shuffle(rows)
+        group_a = rows[:n_a]
+        for column_a, column_b, column, boot, perm in zip(a, b, pooled, boot_diffs, perm_diffs):
+            boot.append(sum(column_a[i] for i in draw_a) / n_a - sum(column_b[i] for i in draw_b) / n_b)
+            sum_a = sum(column[i] for i in group_a)
+            perm.append(sum_a / n_a - (sum(column) - sum_a) / n_b)
+
+    return boot_diffs, perm_diffs
+
+
+def delta_significance(observed: float, boot_diffs: list[float], perm_diffs: list[float]) -> dict:
+    """
+    Summarize resampled mean differences for one metric.
+
+    The interval is the percentile bootstrap at CONFIDENCE_LEVEL; the p-value
+    is the two-sided permutation p-value, with the +1 correction so it is
+    never exactly zero.
+    """
+    resamples = len(boot_diffs)
+    extreme = sum(1 for diff in perm_diffs if abs(diff) >= abs(observed) - 1e-12)
+
+    boot_diffs = sorted(boot_diffs)
+    tail = (1 - CONFIDENCE_LEVEL) / 2
+
+    return {
+        "ci_low": round(boot_diffs[int(tail * (resamples - 1))], 4),
+        "ci_high": round(boot_diffs[int(math.ceil((1 - tail) * (resamples - 1)))], 4),
+        "p_value": round((extreme + 1) / (resamples + 1), 4)
     }
+
+
+def significance_summary(results: dict, baseline: str = "without_skill",
+                         resamples: int = DEFAULT_RESAMPLES, seed: int = 0) -> dict:
     """
-    runs_dir = benchmark_dir / "runs"
+    Bootstrap CIs and permutation p-values for each configuration's deltas
+    against the baseline, keyed by configuration then metric.
 
-    if not runs_dir.exists():
-        print(f"Runs directory not found: {runs_dir}")
-        return {"with_skill": [], "without_skill": []}
+    Uses NumPy when it is installed and a pure-Python path otherwise.
+    Metrics are null when either configuration has no runs.
+    """
+    resample = resample_mean_diffs_numpy if np is not None else resample_mean_diffs_python
+    baseline_columns = [getattr(results[baseline], metric) for metric in SUMMARY_METRICS]
+    significance = {}
 
-    results = {"with_skill": [], "without_skill": []}
+    for config, table in results.items():
+        if config == baseline:
+            continue
+        columns = [getattr(table, metric) for metric in SUMMARY_METRICS]
 
-    for eval_dir in sorted(runs_dir.glob("eval-*")):
-        eval_id = int(eval_dir.name.split("-")[1])
+        if not len(columns[0]) or not len(baseline_columns[0]):
+            significance[config] = {
+                metric: {"ci_low": None, "ci_high": None, "p_value": None}
+                for metric in SUMMARY_METRICS
+            }
+            continue
+
+        boot_diffs, perm_diffs = resample(columns, baseline_columns, resamples, seed)
+        significance[config] = {
+            metric: delta_significance(
+                sum(a) / len(a) - sum(b) / len(b), boot, perm
+            )
+            for metric, a, b, boot, perm in zip(SUMMARY_METRICS, columns, baseline_columns,
+                                                boot_diffs, perm_diffs)
+        }
 
-        for config in ["with_skill", "without_skill"]:
-            config_dir = eval_dir / config
+    significance["resamples"] = resamples
+    significance["confidence"] = CONFIDENCE_LEVEL
+    return significance
 
-            if not config_dir.exists():
-                continue
 
+class Expectation:
+    """One graded expectation, stored without a per-run dict."""
+
+    __slots__ = ("text", "passed", "evidence")
+
+    def __init__(self, text: str, passed: bool, evidence: str):
+        self.text = text
+        self.passed = passed
+        self.evidence = evidence
+
+    def to_dict(self) -> dict:
+        return {"text": self.text, "passed": self.passed, "evidence": self.evidence}
+
+
+def compact_expectation(expectation) -> "Expectation | dict":
+    """
+    Convert a grading.json expectation to an Expectation with interned text.
+
+    The same expectation text repeats in every run of an eval, so interning
+    stores each distinct string once. Expectations carrying fields beyond
+    text/passed/evidence are kept as dicts, and items that aren't objects
+    are kept as they are, so nothing is dropped.
+    """
+    if not isinstance(expectation, dict):
+        return expectation
+    text = expectation.get("text")
+    if isinstance(text, str):
+        text = sys.intern(text)
+
+    if expectation.keys() == EXPECTATION_FIELDS:
+        return Expectation(text, expectation["passed"], expectation["evidence"])
+    return {**expectation, "text": text} if "text" in expectation else expectation
+
+
+class RunTable:
+    """
+    Columnar store for one configuration's run results.
+
+    Numeric fields live in typed arrays and expectations in slotted
+    records, so tens of thousands of runs cost a fraction of a dict per
+    run. Indexing or iterating yields result dicts built on demand in the
+    shape extract_run_result returns; nothing is kept per row.
+    """
+
+    __slots__ = (*RUN_INT_COLUMNS, *RUN_FLOAT_COLUMNS, "expectations", "notes")
+
+    def __init__(self):
+        for column in RUN_INT_COLUMNS:
+            setattr(self, column, array("q"))
+        for column in RUN_FLOAT_COLUMNS:
+            setattr(self, column, array("d"))
+        self.expectations = []
+        self.notes = []
+
+    def append(self, result: dict) -> None:
+        """Append a result whose numeric fields are numbers (see clean_numeric_fields)."""
+        for column in self.__slots__[:-2]:
+            values = getattr(self, column)
+            value = result.get(column, 0)
+            if isinstance(values, array) and type(value) is not COLUMN_TYPES[values.typecode]:
+                values = list(values)
+                setattr(self, column, values)
+            values.append(value)
+        self.expectations.append(tuple(compact_expectation(e) for e in result.get("expectations", [])))
+        self.notes.append(tuple(result.get("notes", [])))
+
+    def __len__(self) -> int:
+        return len(self.eval_id)
+
+    def __getitem__(self, row: int) -> dict:
+        return {
+            "eval_id": self.eval_id[row],
+            "run_number": self.run_number[row],
+            "pass_rate": self.pass_rate[row],
+            "passed": self.passed[row],
+            "failed": self.failed[row],
+            "total": self.total[row],
+            "time_seconds": self.time_seconds[row],
+            "tool_calls": self.tool_calls[row],
+            "tokens": self.tokens[row],
+            "errors": self.errors[row],
+            "expectations": [
+                e.to_dict() if isinstance(e, Expectation) else e
+                for e in self.expectations[row]
+            ],
+            "notes": list(self.notes[row])
+        }
+
+    def __iter__(self):
+        for row in range(len(self)):
+            yield self[row]
+
+
+def clean_numeric_fields(result: dict, grading_file: Path) -> list[str]:
+    """
+    Replace numeric fields of a run result that aren't numbers with 0.
+
+    A malformed value (null, a string, an object) would otherwise abort the
+    whole aggregation. Returns a warning for each field replaced.
+    """
+    warnings = []
+    for column in (*RUN_INT_COLUMNS, *RUN_FLOAT_COLUMNS):
+        value = result.get(column, 0)
+        if not isinstance(value, (int, float)):
+            warnings.append(f"Warning: Non-numeric {column} {value!r} in {grading_file}, using 0")
+            result[column] = 0
+    return warnings
+
+
+def clean_expectations(result: dict, grading_file: Path) -> list[str]:
+    """
+    Replace an expectations value that isn't a list with [].
+
+    Items of a list are left alone; RunSummary skips any that aren't
+    objects. Returns a warning if the value was replaced.
+    """
+    expectations = result.get("expectations", [])
+    if isinstance(expectations, list):
+        return []
+    result["expectations"] = []
+    return [f"Warning: Non-list expectations {expectations!r} in {grading_file}, using []"]
+
+
+def find_run_dirs(runs_dir: Path) -> list[tuple[int, str, int, Path]]:
+    """
+    List (eval_id, config, run_number, run_dir) for every run directory.
+
+    Configurations are discovered from the tree: any subdirectory of an
+    eval directory that contains run-* directories. Entries are returned in
+    the order results are reported: evals sorted by directory name,
+    configurations by config_sort_key, runs sorted by name.
+    """
+    run_dirs = []
+
+    for eval_dir in sorted(runs_dir.glob("eval-*")):
+        eval_id = int(eval_dir.name.split("-")[1])
+        config_dirs = sorted(
+            (path for path in eval_dir.iterdir() if path.is_dir()),
+            key=lambda path: config_sort_key(path.name)
+        )
+
+        for config_dir in config_dirs:
             for run_dir in sorted(config_dir.glob("run-*")):
                 run_number = int(run_dir.name.split("-")[1])
-                grading_file = run_dir / "grading.json"
+                run_dirs.append((eval_id, config_dir.name, run_number, run_dir))
 
-                if not grading_file.exists():
-                    print(f"Warning: grading.json not found in {run_dir}")
-                    continue
+    return run_dirs
 
-                try:
-                    with open(grading_file) as f:
-                        grading = json.load(f)
-                except json.JSONDecodeError as e:
-                    print(f"Warning: Invalid JSON in {grading_file}: {e}")
-                    continue
 
-                # Extract metrics
-                result = {
-                    "eval_id": eval_id,
-                    "run_number": run_number,
-                    "pass_rate": grading.get("summary", {}).get("pass_rate", 0.0),
-                    "passed": grading.get("summary", {}).get("passed", 0),
-                    "failed": grading.get("summary", {}).get("failed", 0),
-                    "total": grading.get("summary", {}).get("total", 0),
-                }
+def read_grading(run_dir: Path) -> tuple[dict | None, str | None]:
+    """
+    Read and parse grading.json from a run directory.
+
+    Returns (grading, warning). Exactly one of the two is None, so callers
+    can report problems in run order even when files are read concurrently.
+    """
+    grading_file = run_dir / "grading.json"
+
+    try:
+        with open(grading_file) as f:
+            return json.load(f), None
+    except FileNotFoundError:
+        return None, f"Warning: grading.json not found in {run_dir}"
+    except json.JSONDecodeError as e:
+        return None, f"Warning: Invalid JSON in {grading_file}: {e}"
 
-                # Extract timing if available
-                timing = grading.get("timing", {})
-                result["time_seconds"] = timing.get("total_duration_seconds", 0.0)
 
-                # Extract metrics if available
-                metrics = grading.get("execution_metrics", {})
-                result["tool_calls"] = metrics.get("total_tool_calls", 0)
-                result["tokens"] = metrics.get("output_chars", 0)  # Placeholder
-                result["errors"] = metrics.get("errors_encountered", 0)
+def count_tokens_approx(text: str) -> int:
+    """
+    Approximate a BPE token count without a tokenizer model.
 
-                # Extract expectations
-                result["expectations"] = grading.get("expectations", [])
+    Each punctuation mark is one token and each word one token per
+    CHARS_PER_TOKEN characters, which tracks common BPE vocabularies
+    closely for English prose and code.
+    """
+    return sum(
+        (len(piece) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+        for piece in TOKEN_PATTERN.findall(text)
+    )
 
-                # Extract notes from user_notes_summary
-                notes_summary = grading.get("user_notes_summary", {})
-                notes = []
-                notes.extend(notes_summary.get("uncertainties", []))
-                notes.extend(notes_summary.get("needs_review", []))
-                notes.extend(notes_summary.get("workarounds", []))
-                result["notes"] = notes
 
-                results[config].append(result)
+@lru_cache(maxsize=None)
+def tiktoken_encoding():
+    return tiktoken.get_encoding("cl100k_base")
 
-    return results
 
+def count_tokens_tiktoken(text: str) -> int:
+    """Exact cl100k_base token count (requires the tiktoken package)."""
+    return len(tiktoken_encoding().encode(text, disallowed_special=()))
 
-def aggregate_results(results: dict) -> dict:
+
+TOKENIZERS = {"approx": count_tokens_approx}
+if tiktoken is not None:
+    TOKENIZERS["tiktoken"] = count_tokens_tiktoken
+
+
+class TokenCounter:
     """
-    Aggregate run results into summary statistics.
+    Token counts for runs, from execution_metrics or the run's transcript.
 
-    Returns run_summary with stats for each configuration and delta.
+    A real count in execution_metrics (see TOKEN_METRIC_KEYS) is used as is.
+    Otherwise the transcript is tokenized with the selected tokenizer and
+    the count cached in <benchmark_dir>/.token_cache by content hash, so an
+    unchanged transcript is never tokenized twice.
     """
-    run_summary = {}
 
-    for config in ["with_skill", "without_skill"]:
-        runs = results.get(config, [])
+    def __init__(self, benchmark_dir: Path, tokenizer: str = DEFAULT_TOKENIZER, use_cache: bool = True):
+        self.cache_file = benchmark_dir / TOKEN_CACHE_FILENAME
+        self.tokenizer = tokenizer
+        self.count_text = TOKENIZERS[tokenizer]
+        self.use_cache = use_cache
+        self.counts = self.load() if use_cache else {}
+        self.changed = False
+
+    def load(self) -> dict:
+        try:
+            with open(self.cache_file) as f:
+                counts = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+        return counts if isinstance(counts, dict) else {}
+
+    def save(self) -> None:
+        if not self.use_cache or not self.changed:
+            return
+        try:
+            with open(self.cache_file, "w") as f:
+                json.dump(self.counts, f, separators=(",", ":"))
+        except OSError as e:
+            print(f"Warning: Could not write token cache {self.cache_file}: {e}")
+
+    def count(self, run_dir: Path, metrics: dict) -> int | float:
+        for key in TOKEN_METRIC_KEYS:
+            value = metrics.get(key)
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                return value
+
+        for transcript_path in TRANSCRIPT_PATHS:
+            try:
+                data = (run_dir / transcript_path).read_bytes()
+            except OSError:
+                continue
 
-        if not runs:
-            run_summary[config] = {
-                "pass_rate": {"mean": 0.0, "stddev": 0.0, "min": 0.0, "max": 0.0},
-                "time_seconds": {"mean": 0.0, "stddev": 0.0, "min": 0.0, "max": 0.0},
-                "tokens": {"mean": 0, "stddev": 0, "min": 0, "max": 0}
-            }
+            key = f"{self.tokenizer}:{hashlib.sha256(data).hexdigest()}"
+            tokens = self.counts.get(key)
+            if tokens is None:
+                tokens = self.count_text(data.decode("utf-8", errors="replace"))
+                self.counts[key] = tokens
+                self.changed = True
+            return tokens
+
+        # No transcript: estimate from the output size the executor recorded
+        return round(metrics.get("output_chars", 0) / CHARS_PER_TOKEN)
+
+
+def extract_run_result(eval_id: int, run_number: int, grading: dict, tokens: int = 0) -> dict:
+    """Extract the metrics aggregation needs from a parsed grading.json."""
+    result = {
+        "eval_id": eval_id,
+        "run_number": run_number,
+        "pass_rate": grading.get("summary", {}).get("pass_rate", 0.0),
+        "passed": grading.get("summary", {}).get("passed", 0),
+        "failed": grading.get("summary", {}).get("failed", 0),
+        "total": grading.get("summary", {}).get("total", 0),
+    }
+
+    # Extract timing if available
+    timing = grading.get("timing", {})
+    result["time_seconds"] = timing.get("total_duration_seconds", 0.0)
+
+    # Extract metrics if available
+    metrics = grading.get("execution_metrics", {})
+    result["tool_calls"] = metrics.get("total_tool_calls", 0)
+    result["tokens"] = tokens
+    result["errors"] = metrics.get("errors_encountered", 0)
+
+    # Extract expectations
+    result["expectations"] = grading.get("expectations", [])
+
+    # Extract notes from user_notes_summary
+    notes_summary = grading.get("user_notes_summary", {})
+    notes = []
+    notes.extend(notes_summary.get("uncertainties", []))
+    notes.extend(notes_summary.get("needs_review", []))
+    notes.extend(notes_summary.get("workarounds", []))
+    result["notes"] = notes
+
+    return result
+
+
+def load_cache(benchmark_dir: Path, tokenizer: str = DEFAULT_TOKENIZER) -> dict:
+    """
+    Load the sidecar cache of extracted run results.
+
+    Returns {relative grading.json path: {"mtime_ns", "size", "transcript", "result"}}.
+    A missing, unreadable or outdated cache, or one built with a different
+    tokenizer, is treated as empty.
+    """
+    cache_file = benchmark_dir / CACHE_FILENAME
+
+    try:
+        with open(cache_file) as f:
+            cache = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+    if not isinstance(cache, dict) or cache.get("version") != CACHE_VERSION:
+        return {}
+    if cache.get("tokenizer") != tokenizer:
+        return {}
+
+    return cache.get("entries", {})
+
+
+def save_cache(benchmark_dir: Path, entries: dict, tokenizer: str = DEFAULT_TOKENIZER) -> None:
+    """Write the sidecar cache atomically so an interrupted run can't corrupt it."""
+    cache_file = benchmark_dir / CACHE_FILENAME
+    tmp_file = cache_file.with_name(cache_file.name + ".tmp")
+
+    try:
+        with open(tmp_file, "w") as f:
+            json.dump({"version": CACHE_VERSION, "tokenizer": tokenizer, "entries": entries},
+                      f, separators=(",", ":"))
+        tmp_file.replace(cache_file)
+    except OSError as e:
+        print(f"Warning: Could not write cache {cache_file}: {e}")
+
+
+def transcript_stamp(run_dir: Path) -> list | None:
+    """[path, mtime_ns, size] of the transcript TokenCounter would read, or None."""
+    for transcript_path in TRANSCRIPT_PATHS:
+        try:
+            stat = (run_dir / transcript_path).stat()
+        except OSError:
             continue
+        return [transcript_path, stat.st_mtime_ns, stat.st_size]
+    return None
 
-        pass_rates = [r["pass_rate"] for r in runs]
-        times = [r["time_seconds"] for r in runs]
-        tokens = [r.get("tokens", 0) for r in runs]
 
-        run_summary[config] = {
-            "pass_rate": calculate_stats(pass_rates),
-            "time_seconds": calculate_stats(times),
-            "tokens": calculate_stats(tokens)
-        }
+def load_run(run: tuple[int, str, int, Path], cached: dict | None,
+             token_counter: TokenCounter | None = None) -> tuple[dict | None, tuple[int, int] | None, bool, str | None]:
+    """
+    Load one run's result, reusing the cached result if grading.json is unchanged.
 
-    # Calculate delta
-    with_skill = run_summary.get("with_skill", {})
-    without_skill = run_summary.get("without_skill", {})
+    Returns (result, stamp, from_cache, warning), where stamp is the
+    (mtime_ns, size) of grading.json plus the transcript_stamp token
+    counts may come from. result and stamp are None when the
+    run could not be loaded.
+    """
+    eval_id, _, run_number, run_dir = run
+    grading_file = run_dir / "grading.json"
 
-    delta_pass_rate = with_skill.get("pass_rate", {}).get("mean", 0) - without_skill.get("pass_rate", {}).get("mean", 0)
-    delta_time = with_skill.get("time_seconds", {}).get("mean", 0) - without_skill.get("time_seconds", {}).get("mean", 0)
-    delta_tokens = with_skill.get("tokens", {}).get("mean", 0) - without_skill.get("tokens", {}).get("mean", 0)
+    try:
+        stat = grading_file.stat()
+    except FileNotFoundError:
+        return None, None, False, f"Warning: grading.json not found in {run_dir}"
 
-    run_summary["delta"] = {
-        "pass_rate": f"{delta_pass_rate:+.2f}",
-        "time_seconds": f"{delta_time:+.1f}",
-        "tokens": f"{delta_tokens:+.0f}"
+    stamp = (stat.st_mtime_ns, stat.st_size, transcript_stamp(run_dir))
+    if cached and (cached.get("mtime_ns"), cached.get("size"), cached.get("transcript")) == stamp:
+        return cached["result"], stamp, True, None
+
+    grading, warning = read_grading(run_dir)
+    if warning:
+        return None, None, False, warning
+
+    metrics = grading.get("execution_metrics", {})
+    tokens = token_counter.count(run_dir, metrics) if token_counter else 0
+    return extract_run_result(eval_id, run_number, grading, tokens), stamp, False, None
+
+
+def load_run_results(benchmark_dir: Path, jobs: int = DEFAULT_JOBS, use_cache: bool = True,
+                     summary: RunSummary | None = None, tokenizer: str = DEFAULT_TOKENIZER) -> dict:
+    """
+    Load all run results from a benchmark directory.
+
+    grading.json files are read and parsed by a pool of `jobs` threads
+    (reading is I/O bound, so threads overlap the wait on slow disks).
+    Results keep directory order regardless of which read finishes first.
+
+    With use_cache, results are also kept in <benchmark_dir>/.aggregate_cache
+    keyed by path, mtime and size of grading.json and of the run's transcript,
+    so only new or changed runs are parsed.
+    If a RunSummary is given, each result is fed to it as it is collected.
+    Token counts come from a TokenCounter using `tokenizer`.
+
+    Returns one RunTable per discovered configuration, in reporting order
+    (see order_configurations):
+    {
+        "with_skill": RunTable([
+            {"eval_id": 1, "run_number": 1, "pass_rate": 0.85, ...},
+            ...
+        ]),
+        "without_skill": RunTable([...])
     }
+    """
+    runs_dir = benchmark_dir / "runs"
+
+    if not runs_dir.exists():
+        print(f"Runs directory not found: {runs_dir}")
+        return {config: RunTable() for config in DEFAULT_CONFIGURATIONS}
+
+    results = {}
+
+    run_dirs = find_run_dirs(runs_dir)
+    keys = [(run_dir / "grading.json").relative_to(benchmark_dir).as_posix()
+            for _, _, _, run_dir in run_dirs]
+    cache = load_cache(benchmark_dir, tokenizer) if use_cache else {}
+    # Pop entries so cached results are released as soon as they are stored
+    cached = [cache.pop(key, None) for key in keys]
+    cached_keys = {key for key, entry in zip(keys, cached) if entry is not None}
+    cache_changed = bool(cache)
+    del cache
+
+    token_counter = TokenCounter(benchmark_dir, tokenizer, use_cache)
+    load = partial(load_run, token_counter=token_counter)
+
+    if jobs > 1 and len(run_dirs) > 1:
+        executor = ThreadPoolExecutor(max_workers=jobs)
+        loaded = executor.map(load, run_dirs, cached)
+    else:
+        executor = None
+        loaded = map(load, run_dirs, cached)
+    del cached
+
+    # key -> (config, row, mtime_ns, size, transcript) for every run that loaded
+    stamps = {}
+    try:
+        for (_, config, _, run_dir), key, (result, stamp, from_cache, warning) in zip(run_dirs, keys, loaded):
+            if warning:
+                print(warning)
+                cache_changed = cache_changed or key in cached_keys
+                continue
+            grading_file = run_dir / "grading.json"
+            for warning in clean_numeric_fields(result, grading_file) + clean_expectations(result, grading_file):
+                print(warning)
+
+            table = results.get(config)
+            if table is None:
+                table = results[config] = RunTable()
+            stamps[key] = (config, len(table), *stamp)
+            table.append(result)
+            cache_changed = cache_changed or not from_cache
+            if summary is not None:
+                summary.add(config, result)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    # Only rewrite the cache when something was added, changed or removed
+    if use_cache and cache_changed:
+        save_cache(benchmark_dir, {
+            key: {"mtime_ns": mtime_ns, "size": size, "transcript": transcript,
+                  "result": results[config][row]}
+            for key, (config, row, mtime_ns, size, transcript) in stamps.items()
+        }, tokenizer)
+    token_counter.save()
+
+    return {config: results.get(config) or RunTable() for config in order_configurations(results)}
+
+
+def aggregate_results(results: dict, baseline: str | None = None) -> dict:
+    """
+    Aggregate already-loaded run results into summary statistics.
+
+    Returns run_summary with stats for each configuration and deltas.
+    generate_benchmark streams runs into a RunSummary instead.
+    """
+    summary = RunSummary()
+    summary.configurations = order_configurations(results)
+    summary.baseline = choose_baseline(summary.configurations, baseline)
+
+    for config, table in results.items():
+        for result in table:
+            summary.add(config, result)
 
-    return run_summary
+    return summary.run_summary()
 
 
-def generate_benchmark(benchmark_dir: Path, skill_name: str = "", skill_path: str = "") -> dict:
+class BenchmarkRuns:
+    """
+    The benchmark.json `runs` array as a lazy view over per-config RunTables.
+
+    Iterating yields one run dict at a time in benchmark.json order (all
+    runs of each configuration in turn), so writing the array never holds
+    a second copy of every run.
+    """
+
+    def __init__(self, results: dict):
+        self.results = results
+
+    def __len__(self) -> int:
+        return sum(len(table) for table in self.results.values())
+
+    def __iter__(self):
+        for config, table in self.results.items():
+            for result in table:
+                yield {
+                    "eval_id": result["eval_id"],
+                    "configuration": config,
+                    "run_number": result["run_number"],
+                    "result": {
+                        "pass_rate": result["pass_rate"],
+                        "passed": result["passed"],
+                        "failed": result["failed"],
+                        "total": result["total"],
+                        "time_seconds": result["time_seconds"],
+                        "tokens": result.get("tokens", 0),
+                        "tool_calls": result.get("tool_calls", 0),
+                        "errors": result.get("errors", 0)
+                    },
+                    "expectations": result["expectations"],
+                    "notes": result["notes"]
+                }
+
+
+def write_benchmark_json(benchmark: dict, output_path: Path, output_format: str = "pretty") -> None:
+    """
+    Stream benchmark data to disk.
+
+    Top-level values are encoded one at a time and list values (the runs
+    array in particular) one item at a time, so lazy views such as
+    BenchmarkRuns are written without being materialized.
+
+    Formats:
+        pretty: same layout as json.dump(..., indent=2)
+        compact: the same document without whitespace
+        ndjson: one {"type": <top-level key>, "data": <value>} object per
+                line, with list values split into one line per item
+    """
+    with open(output_path, "w", buffering=WRITE_BUFFER_SIZE) as f:
+        if output_format == "ndjson":
+            encode = COMPACT_ENCODER.encode
+            for key, value in benchmark.items():
+                items = value if isinstance(value, (list, BenchmarkRuns)) else [value]
+                for item in items:
+                    f.write(encode({"type": key, "data": item}) + "\n")
+            return
+
+        if output_format == "compact":
+            def encode(value, depth: int) -> str:
+                return COMPACT_ENCODER.encode(value)
+            newline, indent, key_sep = "", "", ":"
+        else:
+            def encode(value, depth: int) -> str:
+                return PRETTY_ENCODER.encode(value).replace("\n", "\n" + "  " * depth)
+            newline, indent, key_sep = "\n", "  ", ": "
+
+        f.write("{")
+        for i, (key, value) in enumerate(benchmark.items()):
+            f.write(("," if i else "") + newline + indent + json.dumps(key) + key_sep)
+            if isinstance(value, (list, BenchmarkRuns)) and len(value):
+                f.write("[")
+                for j, item in enumerate(value):
+                    f.write(("," if j else "") + newline + indent * 2 + encode(item, 2))
+                f.write(newline + indent + "]")
+            else:
+                f.write(encode(value, 1))
+        f.write((newline if benchmark else "") + "}")
+
+
+def generate_benchmark(benchmark_dir: Path, skill_name: str = "", skill_path: str = "",
+                       jobs: int = DEFAULT_JOBS, use_cache: bool = True,
+                       resamples: int = 0, seed: int = 0,
+                       tokenizer: str = DEFAULT_TOKENIZER, baseline: str | None = None) -> dict:
     """
     Generate complete benchmark.json from run results.
+
+    Configurations are discovered from the runs/ tree and every other
+    configuration is compared against `baseline` (default: without_skill
+    if present, else the first configuration).
+
+    With resamples > 0, run_summary also gets a `significance` entry with
+    bootstrap confidence intervals and permutation p-values for each delta.
     """
-    results = load_run_results(benchmark_dir)
-    run_summary = aggregate_results(results)
-
-    # Build runs array for benchmark.json
-    runs = []
-    for config in ["with_skill", "without_skill"]:
-        for result in results.get(config, []):
-            runs.append({
-                "eval_id": result["eval_id"],
-                "configuration": config,
-                "run_number": result["run_number"],
-                "result": {
-                    "pass_rate": result["pass_rate"],
-                    "passed": result["passed"],
-                    "failed": result["failed"],
-                    "total": result["total"],
-                    "time_seconds": result["time_seconds"],
-                    "tokens": result.get("tokens", 0),
-                    "tool_calls": result.get("tool_calls", 0),
-                    "errors": result.get("errors", 0)
-                },
-                "expectations": result["expectations"],
-                "notes": result["notes"]
-            })
+    summary = RunSummary()
+    results = load_run_results(benchmark_dir, jobs=jobs, use_cache=use_cache, summary=summary,
+                               tokenizer=tokenizer)
+    summary.configurations = list(results)
+    summary.baseline = choose_baseline(summary.configurations, baseline)
+
+    run_summary = summary.run_summary()
+    if resamples > 0:
+        run_summary["significance"] = significance_summary(results, summary.baseline, resamples, seed)
+    eval_summary = summary.eval_summary()
+    expectation_summary = summary.expectation_summary()
+
+    # runs array for benchmark.json, built from the run tables as it is written
+    runs = BenchmarkRuns(results)
 
     # Determine eval IDs from results
-    eval_ids = sorted(set(
-        r["eval_id"]
-        for config in results.values()
-        for r in config
-    ))
+    eval_ids = sorted(set().union(*(table.eval_id for table in results.values())))
+    runs_per_configuration = max(
+        (max(Counter(table.eval_id).values(), default=0) for table in results.values()),
+        default=0
+    )
 
     benchmark = {
         "metadata": {
@@ -227,20 +1119,58 @@ def generate_benchmark(benchmark_dir: Path, skill_name: str = "", skill_path: st
             "analyzer_model": "<model-name>",
             "timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
             "evals_run": eval_ids,
-            "runs_per_configuration": 3
+            "runs_per_configuration": runs_per_configuration,
+            "configurations": summary.configurations,
+            "baseline": summary.baseline
         },
         "runs": runs,
         "run_summary": run_summary,
+        "eval_summary": eval_summary,
+        "expectation_summary": expectation_summary,
         "notes": []  # To be filled by analyzer
     }
 
     return benchmark
 
 
+def top_by_delta(entries: list[dict], limit: int = BREAKDOWN_ROWS) -> list[dict]:
+    """Return the breakdown entries with the largest absolute pass-rate delta."""
+    return sorted(entries, key=lambda entry: -abs(float(entry["delta"]["pass_rate"])))[:limit]
+
+
+def config_label(config: str) -> str:
+    """Column label for a configuration ("With Skill" for with_skill, names as-is otherwise)."""
+    return config.replace("_", " ").title() if config in DEFAULT_CONFIGURATIONS else config
+
+
+def table_header(cells: list[str]) -> list[str]:
+    """Return a markdown table's header and separator rows."""
+    return [
+        "| " + " | ".join(cells) + " |",
+        "|" + "|".join("-" * (len(cell) + 2) for cell in cells) + "|",
+    ]
+
+
+def entry_deltas(entry: dict, comparisons: list[str]) -> list[dict]:
+    """Return an entry's deltas in comparison order (`deltas` if present, else `delta`)."""
+    if "deltas" in entry:
+        return [entry["deltas"][config] for config in comparisons]
+    return [entry["delta"]]
+
+
 def generate_markdown(benchmark: dict) -> str:
     """Generate human-readable benchmark.md from benchmark data."""
     metadata = benchmark["metadata"]
     run_summary = benchmark["run_summary"]
+    configurations = metadata.get("configurations", list(DEFAULT_CONFIGURATIONS))
+    baseline = metadata.get("baseline", "without_skill")
+    comparisons = [config for config in configurations if config != baseline]
+
+    labels = [config_label(config) for config in configurations]
+    if len(comparisons) > 1:
+        delta_labels = [f"Δ {config_label(config)}" for config in comparisons]
+    else:
+        delta_labels = ["Delta"]
 
     lines = [
         f"# Skill Benchmark: {metadata['skill_name']}",
@@ -248,30 +1178,78 @@ def generate_markdown(benchmark: dict) -> str:
         f"**Model**: {metadata['executor_model']}",
         f"**Date**: {metadata['timestamp']}",
         f"**Evals**: {', '.join(map(str, metadata['evals_run']))} ({metadata['runs_per_configuration']} runs each per configuration)",
+    ]
+    if len(comparisons) > 1 or configurations != list(DEFAULT_CONFIGURATIONS):
+        lines.append(f"**Baseline**: {config_label(baseline)}")
+    lines.extend([
         "",
         "## Summary",
         "",
-        "| Metric | With Skill | Without Skill | Delta |",
-        "|--------|------------|---------------|-------|",
-    ]
+        *table_header(["Metric", *labels, *delta_labels]),
+    ])
+
+    deltas = entry_deltas(run_summary, comparisons)
 
     # Format pass rate
-    with_pr = run_summary["with_skill"]["pass_rate"]
-    without_pr = run_summary["without_skill"]["pass_rate"]
-    delta_pr = run_summary["delta"]["pass_rate"]
-    lines.append(f"| Pass Rate | {with_pr['mean']*100:.0f}% ± {with_pr['stddev']*100:.0f}% | {without_pr['mean']*100:.0f}% ± {without_pr['stddev']*100:.0f}% | {delta_pr} |")
+    cells = [f"{run_summary[config]['pass_rate']['mean']*100:.0f}% ± {run_summary[config]['pass_rate']['stddev']*100:.0f}%"
+             for config in configurations]
+    lines.append("| Pass Rate | " + " | ".join(cells + [delta["pass_rate"] for delta in deltas]) + " |")
 
     # Format time
-    with_time = run_summary["with_skill"]["time_seconds"]
-    without_time = run_summary["without_skill"]["time_seconds"]
-    delta_time = run_summary["delta"]["time_seconds"]
-    lines.append(f"| Time | {with_time['mean']:.1f}s ± {with_time['stddev']:.1f}s | {without_time['mean']:.1f}s ± {without_time['stddev']:.1f}s | {delta_time}s |")
+    cells = [f"{run_summary[config]['time_seconds']['mean']:.1f}s ± {run_summary[config]['time_seconds']['stddev']:.1f}s"
+             for config in configurations]
+    lines.append("| Time | " + " | ".join(cells + [f"{delta['time_seconds']}s" for delta in deltas]) + " |")
 
     # Format tokens
-    with_tokens = run_summary["with_skill"]["tokens"]
-    without_tokens = run_summary["without_skill"]["tokens"]
-    delta_tokens = run_summary["delta"]["tokens"]
-    lines.append(f"| Tokens | {with_tokens['mean']:.0f} ± {with_tokens['stddev']:.0f} | {without_tokens['mean']:.0f} ± {without_tokens['stddev']:.0f} | {delta_tokens} |")
+    cells = [f"{run_summary[config]['tokens']['mean']:.0f} ± {run_summary[config]['tokens']['stddev']:.0f}"
+             for config in configurations]
+    lines.append("| Tokens | " + " | ".join(cells + [delta["tokens"] for delta in deltas]) + " |")
+
+    # Significance of each delta, when computed
+    significance = run_summary.get("significance")
+    if significance:
+        lines.extend([
+            "",
+            "## Significance",
+            "",
+            *table_header(["Metric", f"Delta {significance['confidence']*100:.0f}% CI", "p-value"]),
+        ])
+        for config in comparisons:
+            suffix = f" ({config_label(config)})" if len(comparisons) > 1 else ""
+            for label, metric, fmt in [("Pass Rate", "pass_rate", "+.2f"), ("Time", "time_seconds", "+.1f"), ("Tokens", "tokens", "+.0f")]:
+                stats = significance[config][metric]
+                if stats["p_value"] is None:
+                    lines.append(f"| {label}{suffix} | n/a | n/a |")
+                else:
+                    lines.append(f"| {label}{suffix} | [{stats['ci_low']:{fmt}}, {stats['ci_high']:{fmt}}] | {stats['p_value']:.4f} |")
+
+    # Per-eval breakdown, largest pass-rate deltas first
+    if benchmark.get("eval_summary"):
+        lines.extend([
+            "",
+            "## Evals Driving the Delta",
+            "",
+            *table_header(["Eval", *labels, *delta_labels]),
+        ])
+        for entry in top_by_delta(benchmark["eval_summary"]):
+            cells = [f"{entry[config]['pass_rate']['mean']*100:.0f}% ± {entry[config]['pass_rate']['stddev']*100:.0f}%"
+                     for config in configurations]
+            cells += [delta["pass_rate"] for delta in entry_deltas(entry, comparisons)]
+            lines.append(f"| {entry['eval_id']} | " + " | ".join(cells) + " |")
+
+    # Per-expectation breakdown, largest pass-rate deltas first
+    if benchmark.get("expectation_summary"):
+        lines.extend([
+            "",
+            "## Expectations Driving the Delta",
+            "",
+            *table_header(["Expectation", *labels, *delta_labels]),
+        ])
+        for entry in top_by_delta(benchmark["expectation_summary"]):
+            text = str(entry["text"] or "").replace("|", "\\|")
+            cells = [f"{entry[config]['passed']}/{entry[config]['total']}" for config in configurations]
+            cells += [delta["pass_rate"] for delta in entry_deltas(entry, comparisons)]
+            lines.append(f"| {text} | " + " | ".join(cells) + " |")
 
     # Notes section
     if benchmark.get("notes"):
@@ -286,6 +1264,135 @@ def generate_markdown(benchmark: dict) -> str:
     return "\n".join(lines)
 
 
+def index_record(benchmark: dict, benchmark_dir: Path) -> dict:
+    """Build the compact trend-index record for one benchmark."""
+    metadata = benchmark["metadata"]
+    run_summary = benchmark["run_summary"]
+
+    configurations = metadata.get("configurations", list(DEFAULT_CONFIGURATIONS))
+    baseline = metadata.get("baseline", "without_skill")
+    comparisons = [config for config in configurations if config != baseline]
+
+    return {
+        "benchmark_dir": str(Path(benchmark_dir).resolve()),
+        "timestamp": metadata.get("timestamp", ""),
+        "skill_name": metadata.get("skill_name", ""),
+        "evals": len(metadata.get("evals_run", [])),
+        "runs": len(benchmark.get("runs", [])),
+        # `delta` compares `compared` (the first non-baseline configuration) to `baseline`
+        "baseline": baseline,
+        "compared": comparisons[0] if comparisons else baseline,
+        "means": {
+            config: {
+                metric: run_summary.get(config, {}).get(metric, {}).get("mean", 0.0)
+                for metric in SUMMARY_METRICS
+            }
+            for config in configurations
+        },
+        "delta": run_summary.get("delta", {})
+    }
+
+
+def append_index(index_path: Path, records: list[dict]) -> None:
+    """Append records to the trend index, one compact JSON object per line."""
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(index_path, "a") as f:
+        for record in records:
+            f.write(COMPACT_ENCODER.encode(record) + "\n")
+
+
+def load_index(index_path: Path, skill_name: str = "") -> list[dict]:
+    """
+    Read the trend index, oldest benchmark first.
+
+    The index is append-only, so a benchmark that was re-aggregated appears
+    more than once; its latest record wins. Unparseable lines are skipped.
+    """
+    records = {}
+
+    try:
+        with open(index_path) as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    print(f"Warning: Invalid index record at {index_path}:{line_number}")
+                    continue
+                records[record.get("benchmark_dir")] = record
+    except FileNotFoundError:
+        return []
+
+    selected = [
+        record for record in records.values()
+        if not skill_name or record.get("skill_name") == skill_name
+    ]
+    return sorted(selected, key=lambda record: record.get("timestamp", ""))
+
+
+def reindex_benchmarks(root: Path, index_path: Path) -> int:
+    """
+    Index every <root>/*/benchmark.json that the trend index doesn't have yet.
+
+    Returns the number of records appended. Only benchmarks missing from
+    the index are opened, so re-running this is cheap.
+    """
+    indexed = {record["benchmark_dir"] for record in load_index(index_path)}
+    records = []
+
+    for benchmark_json in sorted(root.glob("*/benchmark.json")):
+        benchmark_dir = benchmark_json.parent.resolve()
+        if str(benchmark_dir) in indexed:
+            continue
+        try:
+            with open(benchmark_json) as f:
+                benchmark = json.load(f)
+            records.append(index_record(benchmark, benchmark_dir))
+        except (json.JSONDecodeError, KeyError, AttributeError) as e:
+            print(f"Warning: Could not index {benchmark_json}: {e}")
+
+    append_index(index_path, records)
+    return len(records)
+
+
+def sparkline(values: list[float]) -> str:
+    """Render values as a one-line unicode sparkline."""
+    if not values:
+        return ""
+    low, high = min(values), max(values)
+    span = (high - low) or 1.0
+    return "".join(SPARK_CHARS[round((value - low) / span * (len(SPARK_CHARS) - 1))] for value in values)
+
+
+def generate_trend_markdown(records: list[dict]) -> str:
+    """Generate a human-readable trend report from trend-index records."""
+    compared_rates = [record["means"][record["compared"]]["pass_rate"] for record in records]
+    deltas = [float(record["delta"].get("pass_rate", 0)) for record in records]
+
+    lines = [
+        "# Skill Benchmark Trend",
+        "",
+        f"**Benchmarks**: {len(records)}",
+        f"**Pass rate**: {sparkline(compared_rates)}",
+        f"**Pass-rate delta**: {sparkline(deltas)}",
+        "",
+        *table_header(["Date", "Skill", "Evals", "Runs", "Compared", "Pass Rate", "Baseline Pass Rate",
+                       "Delta", "Time Delta", "Token Delta"]),
+    ]
+    for record in records:
+        delta = record["delta"]
+        compared, baseline = record["compared"], record["baseline"]
+        lines.append(
+            f"| {record['timestamp']} | {record['skill_name']} | {record['evals']} | {record['runs']} "
+            f"| {config_label(compared)} vs {config_label(baseline)} "
+            f"| {record['means'][compared]['pass_rate']*100:.0f}% | {record['means'][baseline]['pass_rate']*100:.0f}% "
+            f"| {delta.get('pass_rate', '')} | {delta.get('time_seconds', '')}s | {delta.get('tokens', '')} |"
+        )
+
+    return "\n".join(lines)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Aggregate benchmark run results into summary statistics"
@@ -293,7 +1400,8 @@ def main():
     parser.add_argument(
         "benchmark_dir",
         type=Path,
-        help="Path to the benchmark directory"
+        nargs="?",
+        help="Path to the benchmark directory (with --reindex, a directory of benchmark directories)"
     )
     parser.add_argument(
         "--skill-name",
@@ -308,25 +1416,130 @@ def main():
     parser.add_argument(
         "--output", "-o",
         type=Path,
-        help="Output path for benchmark.json (default: <benchmark_dir>/benchmark.json)"
+        help="Output path for benchmark.json (default: <benchmark_dir>/benchmark.json, "
+             "or benchmark.ndjson with --format ndjson)"
+    )
+    parser.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default="pretty",
+        help="benchmark.json layout: indented (pretty), whitespace-free (compact), "
+             "or one record per line for machine consumers (ndjson)"
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=DEFAULT_JOBS,
+        help=f"Number of grading.json files to read concurrently (default: {DEFAULT_JOBS})"
+    )
+    parser.add_argument(
+        "--significance",
+        action="store_true",
+        help="Add bootstrap confidence intervals and permutation-test p-values for each delta"
+    )
+    parser.add_argument(
+        "--resamples",
+        type=int,
+        default=DEFAULT_RESAMPLES,
+        help=f"Resamples for --significance (default: {DEFAULT_RESAMPLES})"
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Random seed for --significance, so results are reproducible (default: 0)"
+    )
+    parser.add_argument(
+        "--baseline",
+        help="Configuration to compare the others against "
+             "(default: without_skill if present, else the first configuration)"
+    )
+    parser.add_argument(
+        "--tokenizer",
+        choices=list(TOKENIZERS),
+        default=DEFAULT_TOKENIZER,
+        help="How to count tokens for runs whose metrics lack a token count: "
+             "approx (fast local estimate) or tiktoken (if installed)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Re-parse every grading.json instead of using <benchmark_dir>/{CACHE_FILENAME}"
+    )
+    parser.add_argument(
+        "--index",
+        type=Path,
+        help="Append-only trend index (one JSON line per benchmark); "
+             "the aggregated benchmark is recorded in it"
+    )
+    parser.add_argument(
+        "--reindex",
+        action="store_true",
+        help="Add every <benchmark_dir>/*/benchmark.json missing from --index, without aggregating"
+    )
+    parser.add_argument(
+        "--trend",
+        action="store_true",
+        help="Render a trend report from --index (filtered by --skill-name) instead of aggregating"
     )
 
     args = parser.parse_args()
 
+    if (args.reindex or args.trend) and not args.index:
+        parser.error("--reindex and --trend require --index")
+
+    if args.trend:
+        records = load_index(args.index, args.skill_name)
+        if not records:
+            print(f"No benchmarks found in index: {args.index}")
+            sys.exit(1)
+        markdown = generate_trend_markdown(records)
+        if args.output:
+            with open(args.output, "w") as f:
+                f.write(markdown)
+            print(f"Generated: {args.output}")
+        else:
+            print(markdown)
+        return
+
+    if args.benchmark_dir is None:
+        parser.error("benchmark_dir is required unless --trend is given")
+
     if not args.benchmark_dir.exists():
         print(f"Directory not found: {args.benchmark_dir}")
         sys.exit(1)
 
+    if args.reindex:
+        added = reindex_benchmarks(args.benchmark_dir, args.index)
+        print(f"Indexed {added} benchmark(s) into {args.index}")
+        return
+
+    if args.jobs < 1:
+        print("--jobs must be at least 1")
+        sys.exit(1)
+
+    if args.significance and args.resamples < 1:
+        print("--resamples must be at least 1")
+        sys.exit(1)
+
     # Generate benchmark
-    benchmark = generate_benchmark(args.benchmark_dir, args.skill_name, args.skill_path)
+    try:
+        benchmark = generate_benchmark(args.benchmark_dir, args.skill_name, args.skill_path,
+                                       jobs=args.jobs, use_cache=not args.no_cache,
+                                       resamples=args.resamples if args.significance else 0,
+                                       seed=args.seed, tokenizer=args.tokenizer,
+                                       baseline=args.baseline)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
 
     # Determine output paths
-    output_json = args.output or (args.benchmark_dir / "benchmark.json")
+    default_name = "benchmark.ndjson" if args.format == "ndjson" else "benchmark.json"
+    output_json = args.output or (args.benchmark_dir / default_name)
     output_md = output_json.with_suffix(".md")
 
     # Write benchmark.json
-    with open(output_json, "w") as f:
-        json.dump(benchmark, f, indent=2)
+    write_benchmark_json(benchmark, output_json, args.format)
     print(f"Generated: {output_json}")
 
     # Write benchmark.md
@@ -335,16 +1548,28 @@ def main():
         f.write(markdown)
     print(f"Generated: {output_md}")
 
+    # Record in the trend index
+    if args.index:
+        append_index(args.index, [index_record(benchmark, args.benchmark_dir)])
+        print(f"Indexed: {args.index}")
+
     # Print summary
     run_summary = benchmark["run_summary"]
-    with_pr = run_summary["with_skill"]["pass_rate"]["mean"]
-    without_pr = run_summary["without_skill"]["pass_rate"]["mean"]
-    delta = run_summary["delta"]["pass_rate"]
+    configurations = benchmark["metadata"]["configurations"]
+    baseline = benchmark["metadata"]["baseline"]
+    comparisons = [config for config in configurations if config != baseline]
+    width = max(len(config_label(config)) + 1 for config in configurations)
+    if len(comparisons) > 1:
+        width = max(width, *(len(f"Δ {config}:") for config in comparisons))
 
     print(f"\nSummary:")
-    print(f"  With skill:    {with_pr*100:.1f}% pass rate")
-    print(f"  Without skill: {without_pr*100:.1f}% pass rate")
-    print(f"  Delta:         {delta}")
+    for config in configurations:
+        label = config_label(config)
+        label = label[0] + label[1:].lower() if config in DEFAULT_CONFIGURATIONS else label
+        print(f"  {label + ':':<{width}} {run_summary[config]['pass_rate']['mean']*100:.1f}% pass rate")
+    for config, delta in zip(comparisons, entry_deltas(run_summary, comparisons)):
+        label = "Delta:" if len(comparisons) == 1 else f"Δ {config}:"
+        print(f"  {label:<{width}} {delta['pass_rate']}")
 
 
 if __name__ == "__main__":
@@ -3,18 +3,64 @@
 Skill Packager - Creates a distributable .skill file of a skill folder
 
 Usage:
-    python utils/package_skill.py <path/to/skill-folder> [output-directory]
+    python utils/package_skill.py <path/to/skill-folder> [output-directory] [--incremental] [--deterministic] [--jobs N]
+    python utils/package_skill.py --library <path/to/skills-root> [output-directory] [--jobs N]
 
 Example:
     python utils/package_skill.py skills/public/my-skill
     python utils/package_skill.py skills/public/my-skill ./dist
+    python utils/package_skill.py skills/public/my-skill ./dist --incremental
+    python utils/package_skill.py --library .agents/skills ./dist
+
+Files are compressed concurrently across --jobs worker threads and written
+in walk order. Media that is already compressed (images, audio, video,
+fonts, archives) is stored as-is rather than deflated. Media and files of
+1 MiB or more are streamed into the archive in chunks, never read whole.
+
+With --incremental, a manifest of every packaged file (size, mtime, SHA-256)
+is kept next to the .skill file. The next incremental build copies the
+compressed data of unchanged files straight from the previous archive and
+only compresses files that changed.
+
+Besides the built-in exclusions (__pycache__, node_modules, *.pyc, the
+skill's top-level evals/ ...), a .skillignore file at the skill root lists
+one glob per line (# starts a comment). A pattern without a slash matches a
+name at any depth, one with a slash matches the path from the skill root,
+and a trailing slash restricts it to directories. Excluded directories are
+never entered.
+
+With --deterministic, identical content always packages to identical bytes:
+entries are sorted by path, timestamps are pinned (to $SOURCE_DATE_EPOCH if
+set, else 1980-01-01) and permissions normalized to 0644/0755. The archive's
+SHA-256 is written to <name>.skill.sha256 in sha256sum format, so downstream
+caches can tell an unchanged skill without unpacking it.
+
+With --library, every folder with a SKILL.md directly under the given root
+is validated and packaged (incrementally and deterministically) across a
+pool of --jobs processes, and <output-directory>/skills_index.json records
+each skill's content digest, archive SHA-256, size and file count. Skills
+whose content digest matches the previous index are skipped.
 """
 
+import argparse
 import fnmatch
+import hashlib
+import json
+import os
+import re
+import struct
 import sys
+import time
 import zipfile
+import zlib
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from quick_validate import validate_skill
+from typing import Callable, Iterable, Iterator
+from quick_validate import CACHE_NAME as VALIDATION_CACHE_NAME
+from quick_validate import cache_key as validation_cache_key
+from quick_validate import validate_skill, validate_skill_md
+from validation_cache import ValidationCache, file_digest
 
 # Patterns to exclude when packaging skills.
 EXCLUDE_DIRS = {"__pycache__", "node_modules"}
@@ -22,30 +68,507 @@ EXCLUDE_GLOBS = {"*.pyc"}
 EXCLUDE_FILES = {".DS_Store"}
 # Directories excluded only at the skill root (not when nested deeper).
 ROOT_EXCLUDE_DIRS = {"evals"}
+# Per-skill exclusions, read from the skill root (and never packaged itself)
+SKILLIGNORE_FILENAME = ".skillignore"
+
+# Already-compressed formats: deflating them costs CPU for no size gain
+STORED_SUFFIXES = {
+    ".png", ".jpg", ".jpeg", ".gif", ".webp", ".avif",
+    ".ogg", ".mp3", ".m4a", ".opus", ".flac", ".mp4", ".webm",
+    ".woff", ".woff2", ".zip", ".gz", ".bz2", ".xz", ".7z", ".skill",
+}
+# zlib's default level, pinned so archives don't vary with the zlib build
+COMPRESS_LEVEL = 6
+DEFAULT_JOBS = os.cpu_count() or 1
+# Stored media and files this large are streamed into the archive in
+# CHUNK_SIZE pieces instead of being read (and compressed) whole
+STREAM_THRESHOLD_BYTES = 1 << 20
+CHUNK_SIZE = 1 << 20
+# Cap on the bytes of files compressed ahead of the writer at any one time
+MAX_PENDING_BYTES = 64 << 20
+
+# Incremental builds: <name>.skill.manifest.json next to <name>.skill
+MANIFEST_SUFFIX = ".manifest.json"
+MANIFEST_VERSION = 1
+
+# Deterministic builds: <name>.skill.sha256 next to <name>.skill
+DIGEST_SUFFIX = ".sha256"
+ZIP_EPOCH = (1980, 1, 1, 0, 0, 0)
+FILE_MODE = 0o100644
+EXEC_FILE_MODE = 0o100755
+ZIP_UNIX_SYSTEM = 3
+
+# Library builds: one index of every packaged skill in the output directory
+LIBRARY_INDEX_FILENAME = "skills_index.json"
+LIBRARY_INDEX_VERSION = 2
+
+# Zip local file header: signature ... filename length, extra field length
+LOCAL_HEADER = struct.Struct("<4s5HL2L2H")
+LOCAL_HEADER_SIGNATURE = b"PK\x03\x04"
+
+
+def translate_path_glob(pattern: str) -> str:
+    """
+    Translate an anchored .skillignore glob to a regex, with gitignore semantics.
+
+    Unlike fnmatch, "*" and "?" never match "/". A whole "**" path segment
+    matches across directories: "**/" matches zero or more directories and a
+    trailing "/**" everything below. Any other "**" is a plain "*".
+    """
+    out = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if pattern.startswith("**", i) and (i == 0 or pattern[i - 1] == "/"):
+            if pattern.startswith("**/", i):
+                out.append("(?:.*/)?")
+                i += 3
+                continue
+            if i + 2 == n:
+                out.append(".*")
+                break
+        if c == "*":
+            while pattern[i + 1:i + 2] == "*":
+                i += 1
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            j = i + 1
+            if pattern[j:j + 1] == "!":
+                j += 1
+            if pattern[j:j + 1] == "]":
+                j += 1
+            end = pattern.find("]", j)
+            if end == -1:
+                out.append("\\[")
+            else:
+                body = pattern[i + 1:end].replace("\\", "\\\\")
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                elif body.startswith(("^", "[")):
+                    body = "\\" + body
+                out.append(f"(?!/)[{body}]")
+                i = end
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return f"(?s:{''.join(out)})\\Z"
+
+
+def compile_globs(patterns, translate: Callable[[str], str] = fnmatch.translate) -> Callable[[str], bool]:
+    """Compile glob patterns into one regex match function (fnmatch syntax by default)."""
+    if not patterns:
+        return lambda name: False
+    return re.compile("|".join(translate(pattern) for pattern in sorted(patterns))).match
+
+
+def read_skillignore(skill_path: Path) -> list[str]:
+    """Patterns from the skill's .skillignore, or [] if it has none."""
+    try:
+        lines = (skill_path / SKILLIGNORE_FILENAME).read_text().splitlines()
+    except OSError:
+        return []
+    patterns = []
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("!"):
+            print(f"Warning: Negated pattern not supported in {SKILLIGNORE_FILENAME}: {line}")
+            continue
+        patterns.append(line)
+    return patterns
+
+
+class ExcludeRules:
+    """
+    What to leave out of one skill's package: the EXCLUDE_* sets plus its .skillignore.
+
+    Every kind of pattern is compiled once into a single regex, so each
+    walked entry costs at most a few regex matches. Paths are relative to
+    the skill root, in posix form. EXCLUDE_DIRS names and ROOT_EXCLUDE_DIRS
+    match files as well as directories, as they always have; only
+    .skillignore patterns ending in "/" are limited to directories.
+    """
+
+    def __init__(self, skill_path: Path):
+        names = EXCLUDE_GLOBS | EXCLUDE_FILES | EXCLUDE_DIRS | {SKILLIGNORE_FILENAME}
+        dir_names = set()
+        paths = set(ROOT_EXCLUDE_DIRS)
+        dir_paths = set()
+
+        for pattern in read_skillignore(skill_path):
+            dir_only = pattern.endswith("/")
+            anchored = "/" in pattern.rstrip("/")
+            pattern = pattern.strip("/")
+            if anchored:
+                (dir_paths if dir_only else paths).add(pattern)
+            else:
+                (dir_names if dir_only else names).add(pattern)
+
+        self.name = compile_globs(names)
+        self.dir_name = compile_globs(dir_names)
+        self.path = compile_globs(paths, translate_path_glob)
+        self.dir_path = compile_globs(dir_paths, translate_path_glob)
+
+    def excludes(self, rel_path: str, name: str, is_dir: bool) -> bool:
+        """Check if an entry at rel_path (relative to the skill root) is excluded."""
+        if self.name(name) or self.path(rel_path):
+            return True
+        return is_dir and bool(self.dir_name(name) or self.dir_path(rel_path))
+
+
+def walk_skill(skill_path: Path, rules: ExcludeRules) -> tuple[list[tuple[Path, str]], list[str]]:
+    """
+    Collect the files to package with one os.scandir pass.
+
+    Excluded directories are pruned rather than entered, and symlinked
+    directories are not followed. Returns ([(file_path, arcname)], [arcnames
+    of excluded entries]), with arcnames relative to skill_path.parent and
+    excluded directories ending in "/".
+    """
+    files = []
+    skipped = []
+    prefix = skill_path.name + "/"
+    stack = [(skill_path, "")]
+
+    while stack:
+        dir_path, rel_dir = stack.pop()
+        with os.scandir(dir_path) as it:
+            for entry in it:
+                rel_path = rel_dir + entry.name
+                is_dir = entry.is_dir(follow_symlinks=False)
+                if not is_dir and not entry.is_file():
+                    continue
+                if rules.excludes(rel_path, entry.name, is_dir):
+                    skipped.append(prefix + rel_path + ("/" if is_dir else ""))
+                elif is_dir:
+                    stack.append((Path(entry.path), rel_path + "/"))
+                else:
+                    files.append((Path(entry.path), prefix + rel_path))
+
+    return files, skipped
+
+
+def load_manifest(manifest_path: Path) -> dict:
+    """Load {arcname: {"size", "mtime_ns", "sha256"}} from a previous build, or {}."""
+    try:
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+        return {}
+    return manifest.get("entries", {})
+
+
+def save_manifest(manifest_path: Path, entries: dict) -> None:
+    """Write the build manifest atomically."""
+    tmp_path = manifest_path.with_name(manifest_path.name + ".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump({"version": MANIFEST_VERSION, "entries": entries}, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, manifest_path)
+
+
+def iter_raw_entry(fp, zinfo: zipfile.ZipInfo) -> Iterator[bytes]:
+    """
+    Yield an entry's stored (still compressed) bytes from an open archive file.
+
+    Reading starts on the first next() and seeks fp, so the entry must be
+    consumed completely before fp is used for anything else.
+    """
+    fp.seek(zinfo.header_offset)
+    header = LOCAL_HEADER.unpack(fp.read(LOCAL_HEADER.size))
+    if header[0] != LOCAL_HEADER_SIGNATURE:
+        raise zipfile.BadZipFile(f"Bad local header for {zinfo.filename}")
+    name_length, extra_length = header[-2:]
+    fp.seek(zinfo.header_offset + LOCAL_HEADER.size + name_length + extra_length)
+    remaining = zinfo.compress_size
+    while remaining:
+        chunk = fp.read(min(remaining, CHUNK_SIZE))
+        if not chunk:
+            raise zipfile.BadZipFile(f"Truncated data for {zinfo.filename}")
+        remaining -= len(chunk)
+        yield chunk
+
+
+def register_entry(zipf: zipfile.ZipFile, zinfo: zipfile.ZipInfo) -> None:
+    """Add an entry whose data has been written to the central directory written on close."""
+    zipf.filelist.append(zinfo)
+    zipf.NameToInfo[zinfo.filename] = zinfo
+    zipf.start_dir = zipf.fp.tell()
+
+
+def write_raw_entry(zipf: zipfile.ZipFile, zinfo: zipfile.ZipInfo, chunks: Iterable[bytes]) -> None:
+    """
+    Append an entry whose data is already compressed.
+
+    zipfile has no public API for this, so the local header is written from
+    zinfo (which must carry the CRC, sizes and compress_type of the data) and
+    the entry is registered for the central directory written on close.
+    """
+    zinfo.header_offset = zipf.fp.tell()
+    zipf.fp.write(zinfo.FileHeader())
+    for chunk in chunks:
+        zipf.fp.write(chunk)
+    register_entry(zipf, zinfo)
+
+
+def copy_entry_info(old_info: zipfile.ZipInfo) -> zipfile.ZipInfo:
+    """Fresh ZipInfo for re-writing an entry of a previous archive unchanged."""
+    zinfo = zipfile.ZipInfo(old_info.filename, old_info.date_time)
+    zinfo.compress_type = old_info.compress_type
+    zinfo.external_attr = old_info.external_attr
+    zinfo.create_system = old_info.create_system
+    zinfo.CRC = old_info.CRC
+    zinfo.compress_size = old_info.compress_size
+    zinfo.file_size = old_info.file_size
+    return zinfo
+
+
+def deterministic_date_time() -> tuple:
+    """Timestamp for every entry of a deterministic build."""
+    try:
+        epoch = int(os.environ.get("SOURCE_DATE_EPOCH", ""))
+    except ValueError:
+        return ZIP_EPOCH
+    return max(ZIP_EPOCH, time.gmtime(epoch)[:6])
+
+
+def normalize_entry_info(zinfo: zipfile.ZipInfo, date_time: tuple) -> None:
+    """Strip the host, mtime and permission bits that make archives differ."""
+    executable = (zinfo.external_attr >> 16) & 0o100
+    zinfo.date_time = date_time
+    zinfo.create_system = ZIP_UNIX_SYSTEM
+    zinfo.external_attr = (EXEC_FILE_MODE if executable else FILE_MODE) << 16
+
+
+def streams(file_path: Path, size: int) -> bool:
+    """Whether a file is written with stream_entry rather than compress_entry."""
+    return size >= STREAM_THRESHOLD_BYTES or file_path.suffix.lower() in STORED_SUFFIXES
+
+
+def stream_entry(zipf: zipfile.ZipFile, file_path: Path, arcname: str,
+                 date_time: tuple | None) -> tuple[zipfile.ZipInfo, str]:
+    """
+    Write one file into zipf in CHUNK_SIZE pieces, as zipf.write would.
+
+    Used for stored media and large files (see streams), so they are never
+    held in memory whole. Runs on the writing thread: the local header is
+    written first and rewritten with the CRC and sizes once the data is in.
+    STORED_SUFFIXES files are stored, everything else deflated.
+
+    Returns (zinfo, SHA-256 of the original bytes).
+    """
+    zinfo = zipfile.ZipInfo.from_file(file_path, arcname)
+    if date_time:
+        normalize_entry_info(zinfo, date_time)
+    stored = file_path.suffix.lower() in STORED_SUFFIXES
+    zinfo.compress_type = zipfile.ZIP_STORED if stored else zipfile.ZIP_DEFLATED
+    zinfo.CRC = zinfo.compress_size = 0
+    # The header's length depends on this, so it is fixed before writing, like zipfile does
+    zip64 = zinfo.file_size * 1.05 > zipfile.ZIP64_LIMIT
+    zinfo.header_offset = zipf.fp.tell()
+    zipf.fp.write(zinfo.FileHeader(zip64))
 
+    compressor = None if stored else zlib.compressobj(COMPRESS_LEVEL, zlib.DEFLATED, -15)
+    digest = hashlib.sha256()
+    crc = file_size = compress_size = 0
+    with open(file_path, "rb") as f:
+        while chunk := f.read(CHUNK_SIZE):
+            crc = zlib.crc32(chunk, crc)
+            file_size += len(chunk)
+            digest.update(chunk)
+            if compressor:
+                chunk = compressor.compress(chunk)
+            zipf.fp.write(chunk)
+            compress_size += len(chunk)
+    if compressor:
+        chunk = compressor.flush()
+        zipf.fp.write(chunk)
+        compress_size += len(chunk)
 
-def should_exclude(rel_path: Path) -> bool:
-    """Check if a path should be excluded from packaging."""
-    parts = rel_path.parts
-    if any(part in EXCLUDE_DIRS for part in parts):
-        return True
-    # rel_path is relative to skill_path.parent, so parts[0] is the skill
-    # folder name and parts[1] (if present) is the first subdir.
-    if len(parts) > 1 and parts[1] in ROOT_EXCLUDE_DIRS:
-        return True
-    name = rel_path.name
-    if name in EXCLUDE_FILES:
-        return True
-    return any(fnmatch.fnmatch(name, pat) for pat in EXCLUDE_GLOBS)
+    zinfo.CRC, zinfo.file_size, zinfo.compress_size = crc, file_size, compress_size
+    end = zipf.fp.tell()
+    zipf.fp.seek(zinfo.header_offset)
+    zipf.fp.write(zinfo.FileHeader(zip64))
+    zipf.fp.seek(end)
+    register_entry(zipf, zinfo)
+    return zinfo, digest.hexdigest()
 
 
-def package_skill(skill_path, output_dir=None):
+def compress_entry(file_path: Path, arcname: str) -> tuple[zipfile.ZipInfo, bytes, str]:
+    """
+    Read and compress one small file, ready for write_raw_entry.
+
+    Runs on a worker thread; zlib and hashlib release the GIL while working
+    on large buffers, so entries compress in parallel. Files that deflate
+    would not shrink are stored.
+
+    Returns (zinfo, compressed data, SHA-256 of the original bytes).
+    """
+    data = file_path.read_bytes()
+    zinfo = zipfile.ZipInfo.from_file(file_path, arcname)
+    zinfo.file_size = len(data)
+    zinfo.CRC = zlib.crc32(data)
+    zinfo.compress_type = zipfile.ZIP_STORED
+    payload = data
+
+    compressor = zlib.compressobj(COMPRESS_LEVEL, zlib.DEFLATED, -15)
+    deflated = compressor.compress(data) + compressor.flush()
+    if len(deflated) < len(data):
+        zinfo.compress_type = zipfile.ZIP_DEFLATED
+        payload = deflated
+
+    zinfo.compress_size = len(payload)
+    return zinfo, payload, hashlib.sha256(data).hexdigest()
+
+
+def write_archive(files: list[tuple[Path, str]], skill_filename: Path,
+                  incremental: bool = False, jobs: int = DEFAULT_JOBS,
+                  verbose: bool = False, deterministic: bool = False) -> dict:
+    """
+    Build skill_filename from (file_path, arcname) pairs.
+
+    Entries are compressed across a pool of jobs threads, at most a few per
+    worker (and MAX_PENDING_BYTES of input) ahead of the writer, and written
+    in the order of files, so the archive layout does not depend on which
+    worker finishes first. Stored media and large files are streamed by the
+    writer instead (see stream_entry), so no file of STREAM_THRESHOLD_BYTES
+    or more is ever held in memory whole.
+
+    With incremental, a file counts as unchanged if its size and mtime match
+    the manifest of the previous build or, failing that, its SHA-256 does;
+    its compressed bytes are then copied from the old archive. The archive
+    is written to a temporary file and swapped in, so a failed build leaves
+    the previous one intact.
+
+    With deterministic, entries are written sorted by arcname with
+    normalized timestamps and permissions (see normalize_entry_info).
+
+    Returns counts of "reused", "compressed" and "stored" entries.
+    """
+    manifest_path = skill_filename.with_name(skill_filename.name + MANIFEST_SUFFIX)
+    manifest = load_manifest(manifest_path) if incremental and skill_filename.exists() else {}
+    old_zip = None
+    if manifest:
+        try:
+            old_zip = zipfile.ZipFile(skill_filename)
+        except (OSError, zipfile.BadZipFile):
+            manifest = {}
+
+    entries = {}
+    counts = {"reused": 0, "compressed": 0, "stored": 0}
+    tmp_filename = skill_filename.with_name(skill_filename.name + ".tmp")
+    date_time = None
+    if deterministic:
+        files = sorted(files, key=lambda item: item[1])
+        date_time = deterministic_date_time()
+
+    def reuse(file_path: Path, arcname: str, entry: dict, st_mode: int) -> Future | None:
+        """Completed future holding the old archive's entry, if still current."""
+        previous = manifest.get(arcname)
+        old_info = old_zip.NameToInfo.get(arcname) if old_zip else None
+        if not previous or not old_info or previous["size"] != entry["size"]:
+            return None
+        if previous["mtime_ns"] == entry["mtime_ns"]:
+            sha256 = previous["sha256"]
+        else:
+            sha256 = file_digest(file_path)
+        if sha256 != previous["sha256"]:
+            return None
+        zinfo = copy_entry_info(old_info)
+        zinfo.external_attr = (st_mode & 0xFFFF) << 16  # permissions may have changed
+        future = Future()
+        # Old entries are read lazily by the writer, the one thread using old_zip.fp
+        future.set_result((zinfo, iter_raw_entry(old_zip.fp, old_info), sha256))
+        return future
+
+    def write_next(zipf: zipfile.ZipFile, pending: deque) -> int:
+        """Write the oldest pending entry; returns the bytes it held in memory."""
+        file_path, arcname, entry, future, kind = pending.popleft()
+        if kind == "stream":
+            zinfo, entry["sha256"] = stream_entry(zipf, file_path, arcname, date_time)
+        else:
+            zinfo, data, entry["sha256"] = future.result()
+            if date_time:
+                normalize_entry_info(zinfo, date_time)
+            write_raw_entry(zipf, zinfo, data if kind == "reuse" else (data,))
+        entries[arcname] = entry
+        if kind == "reuse":
+            counts["reused"] += 1
+        elif zinfo.compress_type == zipfile.ZIP_STORED:
+            counts["stored"] += 1
+        else:
+            counts["compressed"] += 1
+        if verbose:
+            print(f"  Added: {arcname}")
+        return entry["size"] if kind == "compress" else 0
+
+    try:
+        with ThreadPoolExecutor(max_workers=jobs) as executor, \
+                zipfile.ZipFile(tmp_filename, 'w') as zipf:
+            # Only compress_entry results are held in memory: reused entries are
+            # copied and streamed files written in chunks when their turn comes
+            pending = deque()
+            pending_bytes = 0
+            for file_path, arcname in files:
+                st = file_path.stat()
+                entry = {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+                future = reuse(file_path, arcname, entry, st.st_mode) if incremental else None
+                if future is not None:
+                    kind = "reuse"
+                elif streams(file_path, st.st_size):
+                    kind = "stream"
+                else:
+                    kind = "compress"
+                    future = executor.submit(compress_entry, file_path, arcname)
+                    pending_bytes += st.st_size
+                pending.append((file_path, arcname, entry, future, kind))
+                while pending and (len(pending) >= jobs * 4 or pending_bytes > MAX_PENDING_BYTES):
+                    pending_bytes -= write_next(zipf, pending)
+            while pending:
+                write_next(zipf, pending)
+    except BaseException:
+        tmp_filename.unlink(missing_ok=True)
+        raise
+    finally:
+        if old_zip:
+            old_zip.close()
+
+    os.replace(tmp_filename, skill_filename)
+    if incremental:
+        save_manifest(manifest_path, entries)
+    else:
+        # A manifest from an earlier incremental build describes the old archive
+        manifest_path.unlink(missing_ok=True)
+    return counts
+
+
+def write_digest(skill_filename: Path) -> str:
+    """Write <name>.skill.sha256 (sha256sum format) and return the digest."""
+    digest = file_digest(skill_filename)
+    digest_path = skill_filename.with_name(skill_filename.name + DIGEST_SUFFIX)
+    tmp_path = digest_path.with_name(digest_path.name + ".tmp")
+    tmp_path.write_text(f"{digest}  {skill_filename.name}\n")
+    os.replace(tmp_path, digest_path)
+    return digest
+
+
+def package_skill(skill_path, output_dir=None, incremental=False, jobs=DEFAULT_JOBS,
+                  deterministic=False):
     """
     Package a skill folder into a .skill file.
 
     Args:
         skill_path: Path to the skill folder
         output_dir: Optional output directory for the .skill file (defaults to current directory)
+        incremental: Reuse compressed entries of unchanged files from the
+            previous incremental build (see write_archive)
+        jobs: Number of threads compressing files concurrently
+        deterministic: Produce byte-identical archives for identical content
+            and write the archive's digest beside it (see write_digest)
 
     Returns:
         Path to the created .skill file, or None if error
@@ -88,17 +611,23 @@ def package_skill(skill_path, output_dir=None):
 
     # Create the .skill file (zip format)
     try:
-        with zipfile.ZipFile(skill_filename, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            # Walk through the skill directory, excluding build artifacts
-            for file_path in skill_path.rglob('*'):
-                if not file_path.is_file():
-                    continue
-                arcname = file_path.relative_to(skill_path.parent)
-                if should_exclude(arcname):
-                    print(f"  Skipped: {arcname}")
-                    continue
-                zipf.write(file_path, arcname)
-                print(f"  Added: {arcname}")
+        # Walk through the skill directory, excluding build artifacts
+        files, skipped = walk_skill(skill_path, ExcludeRules(skill_path))
+        if not incremental:
+            for arcname in skipped:
+                print(f"  Skipped: {arcname}")
+
+        counts = write_archive(files, skill_filename, incremental, jobs,
+                               verbose=not incremental, deterministic=deterministic)
+        if incremental:
+            print(f"  Reused {counts['reused']}, compressed {counts['compressed']}, "
+                  f"stored {counts['stored']}, skipped {len(skipped)} path(s)")
+        digest_path = skill_filename.with_name(skill_filename.name + DIGEST_SUFFIX)
+        if deterministic:
+            print(f"  SHA-256: {write_digest(skill_filename)}")
+        else:
+            # A digest from an earlier deterministic build no longer applies
+            digest_path.unlink(missing_ok=True)
 
         print(f"\n✅ Successfully packaged skill to: {skill_filename}")
         return skill_filename
@@ -108,23 +637,185 @@ def package_skill(skill_path, output_dir=None):
         return None
 
 
+def content_digest(files: list[tuple[Path, str]], manifest: dict) -> str:
+    """
+    SHA-256 over the (arcname, mode, file SHA-256) of each file of a skill, in arcname order.
+
+    mode is the one normalize_entry_info gives the entry, so making a file
+    executable (or not) changes the digest just as it changes the archive.
+
+    File hashes are taken from an incremental build manifest when the file's
+    size and mtime still match, so an unchanged skill is hashed from stat()
+    calls alone.
+    """
+    digest = hashlib.sha256()
+    for file_path, arcname in sorted(files, key=lambda item: item[1]):
+        st = file_path.stat()
+        previous = manifest.get(arcname)
+        if previous and previous["size"] == st.st_size and previous["mtime_ns"] == st.st_mtime_ns:
+            sha256 = previous["sha256"]
+        else:
+            sha256 = file_digest(file_path)
+        mode = EXEC_FILE_MODE if st.st_mode & 0o100 else FILE_MODE
+        digest.update(f"{arcname}\0{mode:o}\0{sha256}\n".encode())
+    return digest.hexdigest()
+
+
+def load_library_index(index_path: Path) -> dict:
+    """Load {skill name: entry} from a previous library build, or {}."""
+    try:
+        with open(index_path) as f:
+            index = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if not isinstance(index, dict) or index.get("version") != LIBRARY_INDEX_VERSION:
+        return {}
+    return index.get("skills", {})
+
+
+def package_library_skill(skill_path: Path, output_path: Path, previous: dict | None,
+                          verdict: list | None) -> dict:
+    """
+    Validate and package one skill of a library build; runs in a worker process.
+
+    verdict is the cached quick_validate verdict for the skill's SKILL.md,
+    if the parent has one; workers never touch the cache file themselves.
+
+    Returns {"name", "status", "message", "entry", "verdict"}, where status
+    is "unchanged" (content digest matches previous and the .skill exists),
+    "packaged", "invalid" or "error", entry is the skill's index record and
+    verdict is a freshly computed validation verdict for the parent to cache.
+    """
+    result = {"name": skill_path.name, "status": "error", "message": "", "entry": None,
+              "verdict": None}
+    skill_filename = output_path / f"{skill_path.name}.skill"
+    manifest_path = skill_filename.with_name(skill_filename.name + MANIFEST_SUFFIX)
+
+    try:
+        files, _ = walk_skill(skill_path, ExcludeRules(skill_path))
+        digest = content_digest(files, load_manifest(manifest_path))
+        if previous and previous.get("digest") == digest and skill_filename.exists():
+            result.update(status="unchanged", entry=previous)
+            return result
+
+        if verdict is None:
+            verdict = result["verdict"] = list(validate_skill_md(skill_path / "SKILL.md"))
+        valid, message = verdict
+        if not valid:
+            result.update(status="invalid", message=message)
+            return result
+
+        # Threads would only contend with the other worker processes
+        write_archive(files, skill_filename, incremental=True, jobs=1, deterministic=True)
+        result.update(status="packaged", entry={
+            "digest": digest,
+            "sha256": write_digest(skill_filename),
+            "size": skill_filename.stat().st_size,
+            "files": len(files),
+        })
+    except Exception as e:
+        result["message"] = str(e)
+    return result
+
+
+def package_library(library_path, output_dir=None, jobs=DEFAULT_JOBS):
+    """
+    Package every skill under a library root into output_dir.
+
+    Args:
+        library_path: Folder whose subfolders with a SKILL.md are skills
+        output_dir: Output directory for the .skill files and the index
+            (defaults to current directory)
+        jobs: Number of worker processes
+
+    Returns:
+        Path to the written index, or None if any skill failed
+    """
+    library_path = Path(library_path).resolve()
+    if not library_path.is_dir():
+        print(f"❌ Error: Library folder not found: {library_path}")
+        return None
+
+    skill_paths = sorted(path for path in library_path.iterdir() if (path / "SKILL.md").is_file())
+    if not skill_paths:
+        print(f"❌ Error: No skills (folders with a SKILL.md) in {library_path}")
+        return None
+
+    output_path = Path(output_dir).resolve() if output_dir else Path.cwd()
+    output_path.mkdir(parents=True, exist_ok=True)
+    index_path = output_path / LIBRARY_INDEX_FILENAME
+    previous_index = load_library_index(index_path)
+
+    # One validation cache for the whole library, read and written only here
+    cache = ValidationCache(VALIDATION_CACHE_NAME)
+    keys = [validation_cache_key(cache, path / "SKILL.md") for path in skill_paths]
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(skill_paths))) as executor:
+        results = list(executor.map(
+            package_library_skill,
+            skill_paths,
+            [output_path] * len(skill_paths),
+            [previous_index.get(path.name) for path in skill_paths],
+            [cache.get(key) if key else None for key in keys],
+        ))
+
+    for key, result in zip(keys, results):
+        if key and result["verdict"] is not None:
+            cache.put(key, result["verdict"])
+    cache.save()
+
+    skills = {}
+    counts = {"packaged": 0, "unchanged": 0, "invalid": 0, "error": 0}
+    for result in results:
+        counts[result["status"]] += 1
+        if result["entry"]:
+            skills[result["name"]] = result["entry"]
+        if result["status"] == "packaged":
+            print(f"  Packaged: {result['name']}")
+        elif result["status"] in ("invalid", "error"):
+            print(f"  ❌ {result['name']}: {result['message']}")
+
+    tmp_path = index_path.with_name(index_path.name + ".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump({"version": LIBRARY_INDEX_VERSION, "skills": skills}, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, index_path)
+
+    print(f"\n  Packaged {counts['packaged']}, unchanged {counts['unchanged']}, "
+          f"invalid {counts['invalid']}, failed {counts['error']} of {len(skill_paths)} skill(s)")
+    if counts["invalid"] or counts["error"]:
+        print(f"❌ Some skills were not packaged; index written to: {index_path}")
+        return None
+    print(f"✅ Successfully packaged library to: {output_path} (index: {index_path.name})")
+    return index_path
+
+
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python utils/package_skill.py <path/to/skill-folder> [output-directory]")
-        print("\nExample:")
-        print("  python utils/package_skill.py skills/public/my-skill")
-        print("  python utils/package_skill.py skills/public/my-skill ./dist")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(description="Package a skill folder into a .skill file")
+    parser.add_argument("skill_path", help="Path to the skill folder (with --library, the library root)")
+    parser.add_argument("output_dir", nargs="?", default=None,
+                        help="Output directory for the .skill file (default: current directory)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Reuse compressed entries of unchanged files from the previous build")
+    parser.add_argument("--deterministic", action="store_true",
+                        help="Sort entries, normalize timestamps and permissions, and write <name>.skill.sha256")
+    parser.add_argument("--library", action="store_true",
+                        help="Package every skill under skill_path and write skills_index.json")
+    parser.add_argument("--jobs", type=int, default=DEFAULT_JOBS,
+                        help=f"Threads compressing files, or with --library worker processes (default: {DEFAULT_JOBS})")
+    args = parser.parse_args()
 
-    skill_path = sys.argv[1]
-    output_dir = sys.argv[2] if len(sys.argv) > 2 else None
+    if args.library:
+        print(f"📦 Packaging library: {args.skill_path}")
+        result = package_library(args.skill_path, args.output_dir, max(1, args.jobs))
+        sys.exit(0 if result else 1)
 
-    print(f"📦 Packaging skill: {skill_path}")
-    if output_dir:
-        print(f"   Output directory: {output_dir}")
+    print(f"📦 Packaging skill: {args.skill_path}")
+    if args.output_dir:
+        print(f"   Output directory: {args.output_dir}")
     print()
 
-    result = package_skill(skill_path, output_dir)
+    result = package_skill(args.skill_path, args.output_dir, args.incremental, max(1, args.jobs),
+                           args.deterministic)
 
     if result:
         sys.exit(0)
@@ -3,24 +3,90 @@
 Prepare environment for running a skill eval.
 
 Usage:
-    prepare_eval.py <skill-path> <eval-id> --output-dir <dir> [--no-skill]
+    prepare_eval.py <skill-path> <eval-id> --output-dir <dir> [--no-skill] [--staging <mode>]
+                    [--input-store <dir>] [--snapshot-store <dir>]
+    prepare_eval.py <skill-path> --all --output-dir <benchmark-dir> [--evals <ids>]
+                    [--runs <n>] [--jobs <n>] [--staging <mode>]
 
 Examples:
     prepare_eval.py skills/public/pdf 0 --output-dir workspace/eval-001/with-skill
     prepare_eval.py skills/public/pdf 0 --output-dir workspace/eval-001/without-skill --no-skill
+    prepare_eval.py skills/public/pdf --all --output-dir workspace/benchmarks/2026-01-15
 
 Options:
     <skill-path>     Path to the skill directory
     <eval-id>        Index of the eval in evals/evals.json (0-based)
     --output-dir     Directory to prepare for the eval run
     --no-skill       If set, do not copy the skill (for baseline comparison)
+    --staging        How the skill and input files are staged:
+                       copy  full copies (default)
+                       link  reflinks where the filesystem supports them,
+                             else copies. Files from --input-store may also
+                             be hardlinked to the store's read-only copy,
+                             but nothing is ever hardlinked to an original.
+    --input-store    Content-addressed store to keep one copy of each input
+                     file in; inputs/ then links (or hardlinks) to it
+    --snapshot-store Directory of skill snapshots keyed by content hash;
+                     skill/ then links to the snapshot of the current skill,
+                     which is only created if no identical one exists
+
+Batch mode (--all) loads evals.json once and prepares
+<benchmark-dir>/runs/eval-<id>/{with_skill,without_skill}/run-<k> for every
+eval (or the comma-separated indexes given to --evals) across a pool of
+--jobs workers, --runs runs per configuration (default 3), then writes
+<benchmark-dir>/eval_manifest.json listing every prepared run. Input files
+always go through the store <benchmark-dir>/.inputs, and with-skill runs
+link to a snapshot in <benchmark-dir>/.snapshots.
 """
 
+import errno
+import hashlib
 import json
 import os
+import re
 import shutil
+import stat
 import sys
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from validation_cache import cache_dir
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows
+    fcntl = None
+
+
+STAGING_MODES = ("copy", "link")
+
+# ioctl request for cloning a file's extents (Linux: btrfs, XFS, bcachefs, ...)
+FICLONE = 0x40049409
+
+# Errors meaning the filesystem (pair) can't reflink at all; remembered per
+# (source device, destination device) so later files skip the attempt
+REFLINK_UNSUPPORTED = {errno.EOPNOTSUPP, errno.ENOTTY, errno.EINVAL, errno.EXDEV, errno.ENOSYS}
+NO_REFLINK = set()
+
+# Write permission bits cleared by the read-only guard
+WRITE_BITS = stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH
+
+# Batch mode layout, matching what aggregate_benchmark.py reads
+BATCH_CONFIGURATIONS = ("with_skill", "without_skill")
+DEFAULT_RUNS = 3
+DEFAULT_JOBS = 8
+MANIFEST_FILENAME = "eval_manifest.json"
+INPUT_STORE_DIRNAME = ".inputs"
+SNAPSHOT_STORE_DIRNAME = ".snapshots"
+
+# Byte-offset index for large evals.json files, kept in the user's cache
+# directory (never in the skill) as evals_index/<hash of evals.json path>.json
+EVALS_INDEX_DIRNAME = "evals_index"
+LEGACY_EVALS_INDEX_FILENAME = ".evals_index.json"  # evals/ sidecar of older versions
+EVALS_INDEX_VERSION = 2
+EVALS_INDEX_MIN_BYTES = 1 << 20
+JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
 
 
 def is_writable(path: Path) -> bool:
@@ -34,12 +100,313 @@ def is_writable(path: Path) -> bool:
         return False
 
 
-def load_evals(skill_path: Path) -> list:
-    """Load evals from the skill's evals/evals.json file."""
+def reflink(source: Path, dest: Path) -> bool:
+    """Clone source to dest as a copy-on-write reflink. False if unsupported."""
+    if fcntl is None:
+        return False
+    devices = (os.stat(source).st_dev, os.stat(dest.parent).st_dev)
+    if devices in NO_REFLINK:
+        return False
+    try:
+        with open(source, "rb") as src, open(dest, "wb") as dst:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+    except OSError as e:
+        dest.unlink(missing_ok=True)
+        if e.errno in REFLINK_UNSUPPORTED:
+            NO_REFLINK.add(devices)
+        return False
+    shutil.copystat(source, dest)
+    return True
+
+
+def stage_file(source: Path, dest: Path, mode: str = "copy") -> str:
+    """
+    Stage one file at dest, replacing anything already there.
+
+    "link" reflinks where the filesystem supports it, else copies.
+    "hardlink" also tries a hardlink before copying; a hardlink shares its
+    inode with source, so it is only for sources in one of the private
+    read-only stores (InputStore blobs), never a file the user owns.
+    Returns how it was staged: "reflink", "hardlink" or "copy".
+    """
+    source, dest = Path(source), Path(dest)
+    if dest.exists() or dest.is_symlink():
+        dest.unlink()
+
+    if mode in ("link", "hardlink"):
+        if reflink(source, dest):
+            return "reflink"
+    if mode == "hardlink":
+        try:
+            os.link(source, dest)
+        except OSError:
+            pass
+        else:
+            return "hardlink"
+
+    shutil.copy2(source, dest)
+    return "copy"
+
+
+def stage_tree(source: Path, dest: Path, mode: str = "copy", methods: Counter | None = None,
+               store: "InputStore | None" = None, exclude: set[str] = frozenset()) -> Counter:
+    """
+    Stage a directory tree at dest (merging into an existing one).
+
+    Files go through store when one is given. Top-level entries named in
+    exclude are skipped. Returns a Counter of how files were staged, added
+    to methods if given.
+    """
+    methods = Counter() if methods is None else methods
+
+    def stage(src, dst):
+        if store is not None:
+            methods[store.stage(Path(src), Path(dst))] += 1
+        else:
+            methods[stage_file(Path(src), Path(dst), mode)] += 1
+        return dst
+
+    def ignore(directory, names):
+        return [name for name in names if name in exclude] if Path(directory) == Path(source) else []
+
+    shutil.copytree(source, dest, copy_function=stage, dirs_exist_ok=True, ignore=ignore)
+    return methods
+
+
+def remove_path(path: Path) -> None:
+    """Remove a file, symlink or directory tree."""
+    if path.is_symlink() or not path.is_dir():
+        path.unlink()
+    else:
+        shutil.rmtree(path)
+
+
+def remove_read_only_tree(path: Path) -> None:
+    """Remove a directory tree whose directories may have had their write bits cleared."""
+    for dirpath, _, _ in os.walk(path):
+        os.chmod(dirpath, stat.S_IMODE(os.stat(dirpath).st_mode) | stat.S_IWUSR)
+    shutil.rmtree(path)
+
+
+def excluded_entries(skill_path: Path, *paths: Path) -> set[str]:
+    """
+    Top-level entries of skill_path that contain any of paths.
+
+    A workspace inside the skill directory holds the runs themselves, so it
+    must never be part of the skill's snapshot or copy.
+    """
+    excluded = set()
+    for path in paths:
+        try:
+            excluded.add(Path(path).resolve().relative_to(skill_path).parts[0])
+        except (ValueError, IndexError):
+            pass
+    return excluded
+
+
+class SkillSnapshots:
+    """
+    Store of read-only skill snapshots keyed by a hash of the skill tree.
+
+    A with-skill run's skill/ becomes a relative symlink to the snapshot of
+    the skill's current content, so runs share one copy and re-preparing a
+    run whose skill is unchanged only checks the link. Tree hashes are
+    remembered per skill path against a stat signature of its files
+    (index.json), so unchanged skills are not re-read to be hashed. Like
+    InputStore blobs, snapshots are copied (or reflinked) from the skill,
+    never hardlinked, so editing the skill can't change a snapshot. Files
+    and directories alike are read-only; remove_read_only_tree deletes one.
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root).resolve()
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.index_path = self.root / "index.json"
+
+    def load_index(self) -> dict:
+        try:
+            with open(self.index_path) as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    def save_index(self, index: dict) -> None:
+        tmp = self.index_path.with_name(f"index.json.{os.getpid()}.tmp")
+        with open(tmp, "w") as f:
+            json.dump(index, f, indent=2)
+        os.replace(tmp, self.index_path)
+
+    def tree_hash(self, skill_path: Path, exclude: set[str]) -> str:
+        """Hash file paths and contents under skill_path (minus exclude)."""
+        files = []
+        for dirpath, dirnames, filenames in os.walk(skill_path):
+            if Path(dirpath) == skill_path:
+                dirnames[:] = [d for d in dirnames if d not in exclude]
+                filenames = [f for f in filenames if f not in exclude]
+            for filename in filenames:
+                path = Path(dirpath) / filename
+                files.append((path.relative_to(skill_path).as_posix(), path))
+        files.sort()
+
+        signature = hashlib.sha256()
+        for rel_path, path in files:
+            st = path.stat()
+            signature.update(f"{rel_path}\0{st.st_size}\0{st.st_mtime_ns}\n".encode())
+        signature = signature.hexdigest()
+
+        index = self.load_index()
+        entry = index.get(str(skill_path))
+        if entry and entry.get("signature") == signature:
+            return entry["tree"]
+
+        tree = hashlib.sha256()
+        for rel_path, path in files:
+            tree.update(rel_path.encode() + b"\0")
+            with open(path, "rb") as f:
+                tree.update(hashlib.sha256(f.read()).digest())
+        tree = tree.hexdigest()[:32]
+
+        index[str(skill_path)] = {"signature": signature, "tree": tree}
+        self.save_index(index)
+        return tree
+
+    def snapshot(self, skill_path: Path, exclude: set[str] = frozenset()) -> Path:
+        """Return the snapshot directory for skill_path's content, creating it if needed."""
+        skill_path = Path(skill_path).resolve()
+        snapshot = self.root / self.tree_hash(skill_path, exclude)
+        if not snapshot.exists():
+            tmp = snapshot.with_name(f"{snapshot.name}.{os.getpid()}.tmp")
+            if tmp.exists():
+                remove_read_only_tree(tmp)
+            stage_tree(skill_path, tmp, "link", exclude=exclude)
+            # Every with-skill run links to this one tree, so its directories
+            # are made read-only too: a file added by one run must not show up
+            # in the others (or in a snapshot whose key no longer matches).
+            for dirpath, _, filenames in os.walk(tmp, topdown=False):
+                for path in [os.path.join(dirpath, name) for name in filenames] + [dirpath]:
+                    os.chmod(path, stat.S_IMODE(os.lstat(path).st_mode) & ~WRITE_BITS)
+            try:
+                os.rename(tmp, snapshot)
+            except OSError:
+                remove_read_only_tree(tmp)  # another process created it first
+        return snapshot
+
+
+def link_snapshot(snapshot: Path, dest: Path) -> bool:
+    """Point dest at snapshot with a relative symlink. True if it already did."""
+    target = os.path.relpath(snapshot, dest.parent)
+    if dest.is_symlink() and os.readlink(dest) == target:
+        return True
+    if dest.exists() or dest.is_symlink():
+        remove_path(dest)
+    os.symlink(target, dest, target_is_directory=True)
+    return False
+
+
+class InputStore:
+    """
+    Content-addressed store for staged input files.
+
+    Each distinct file content is stored once, as <root>/<sha256[:2]>/<sha256>
+    (read-only), and every run's inputs/ links to it, so disk use grows with
+    the number of unique fixtures rather than the number of runs. Blobs are
+    copied (or reflinked) from the source, never hardlinked, so later edits
+    to a fixture can't change a stored blob.
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.digests = {}  # (path, mtime_ns, size) -> sha256
+
+    def digest(self, source: Path) -> str:
+        """SHA-256 of a file, memoized while the file is unchanged."""
+        st = source.stat()
+        key = (str(source), st.st_mtime_ns, st.st_size)
+        if key not in self.digests:
+            digest = hashlib.sha256()
+            with open(source, "rb") as f:
+                while chunk := f.read(1 << 20):
+                    digest.update(chunk)
+            self.digests[key] = digest.hexdigest()
+        return self.digests[key]
+
+    def add(self, source: Path) -> Path:
+        """Store source's content if it isn't stored yet; return the blob path."""
+        digest = self.digest(source)
+        blob = self.root / digest[:2] / digest
+        if not blob.exists():
+            blob.parent.mkdir(exist_ok=True)
+            # Unique temp name so concurrent workers never share a partial blob
+            tmp = blob.with_name(f"{digest}.{os.getpid()}.{threading.get_ident()}.tmp")
+            if not reflink(source, tmp):
+                shutil.copy2(source, tmp)
+            os.chmod(tmp, stat.S_IMODE(tmp.stat().st_mode) & ~WRITE_BITS)
+            os.replace(tmp, blob)
+        return blob
+
+    def stage(self, source: Path, dest: Path) -> str:
+        """Stage source at dest as a link to its blob; returns how, like stage_file."""
+        return stage_file(self.add(source), dest, "hardlink")
+
+
+class EvalsIndex:
+    """
+    Index of a skill's evals/ tree, built with one walk.
+
+    Resolves eval file references the way prepare_eval always has (under
+    evals/files/, then evals/, then the skill root) with dict lookups instead
+    of probing the filesystem for each candidate.
+    """
+
+    def __init__(self, skill_path: Path):
+        self.skill_path = Path(skill_path).resolve()
+        self.paths = {}  # path relative to evals/ (posix) -> absolute path
+        evals_dir = self.skill_path / "evals"
+        for dirpath, dirnames, filenames in os.walk(evals_dir):
+            rel_dir = Path(dirpath).relative_to(evals_dir)
+            for name in dirnames + filenames:
+                self.paths[(rel_dir / name).as_posix()] = Path(dirpath) / name
+
+    def resolve(self, file_ref: str) -> Path | None:
+        """
+        Return the source path for a file reference, or None if not found.
+
+        Raises ValueError if the reference (after following symlinks) points
+        outside the skill directory.
+        """
+        ref = os.path.normpath(file_ref).replace(os.sep, "/")
+        for key in (f"files/{ref}", ref):
+            if key in self.paths:
+                source = self.paths[key]
+                break
+        else:
+            # Outside evals/: relative to the skill root
+            source = self.skill_path / file_ref
+            if not source.exists():
+                return None
+        if not source.resolve().is_relative_to(self.skill_path):
+            raise ValueError(f"File reference outside the skill directory: {file_ref}")
+        return source
+
+
+def load_evals(skill_path: Path, lazy: bool | None = None) -> list:
+    """
+    Load evals from the skill's evals/evals.json file.
+
+    With lazy (the default for files of EVALS_INDEX_MIN_BYTES or more), a
+    LazyEvals is returned instead of a list, so only the evals actually
+    used are parsed.
+    """
     evals_file = skill_path / "evals" / "evals.json"
     if not evals_file.exists():
         raise FileNotFoundError(f"Evals file not found: {evals_file}")
 
+    if lazy is None:
+        lazy = evals_file.stat().st_size >= EVALS_INDEX_MIN_BYTES
+    if lazy:
+        return LazyEvals(evals_file, load_evals_index(evals_file))
+
     with open(evals_file, "r") as f:
         data = json.load(f)
 
@@ -57,6 +424,126 @@ def load_evals(skill_path: Path) -> list:
     return evals
 
 
+def eval_byte_ranges(text: str) -> list[tuple[int, int]]:
+    """
+    Find the [start, end) byte range of every eval record in evals.json text.
+
+    Accepts the same two layouts as load_evals: a top-level list, or an
+    object whose "evals" member is the list.
+    """
+    decoder = json.JSONDecoder()
+
+    def skip(pos):
+        return JSON_WHITESPACE.match(text, pos).end()
+
+    pos = skip(0)
+    if text.startswith("{", pos):
+        pos = skip(pos + 1)
+        while not text.startswith("}", pos):
+            key, pos = decoder.raw_decode(text, pos)
+            pos = skip(pos)
+            if not text.startswith(":", pos):
+                raise ValueError(f"Invalid evals.json: expected ':' at char {pos}")
+            pos = skip(pos + 1)
+            if key == "evals" and text.startswith("[", pos):
+                break
+            _, pos = decoder.raw_decode(text, pos)
+            pos = skip(pos)
+            if text.startswith(",", pos):
+                pos = skip(pos + 1)
+        else:
+            raise ValueError("Expected evals.json to contain a list or object with 'evals' key, got dict")
+    elif not text.startswith("[", pos):
+        raise ValueError("Expected evals.json to contain a list or object with 'evals' key")
+
+    # pos is at the '[' of the evals array
+    spans = []
+    pos = skip(pos + 1)
+    while not text.startswith("]", pos):
+        _, end = decoder.raw_decode(text, pos)
+        spans.append((pos, end))
+        pos = skip(end)
+        if text.startswith(",", pos):
+            pos = skip(pos + 1)
+        elif not text.startswith("]", pos):
+            raise ValueError(f"Invalid evals.json: expected ',' or ']' at char {pos}")
+
+    # Character offsets -> byte offsets, encoding each stretch once
+    ranges = []
+    char_pos = byte_pos = 0
+    for start, end in spans:
+        byte_pos += len(text[char_pos:start].encode("utf-8"))
+        start_byte = byte_pos
+        byte_pos += len(text[start:end].encode("utf-8"))
+        ranges.append((start_byte, byte_pos))
+        char_pos = end
+
+    return ranges
+
+
+def load_evals_index(evals_file: Path) -> list[list[int]]:
+    """
+    Return the byte range of each eval in evals_file from its cached index.
+
+    The index lives under the skill-creator cache directory, keyed by the
+    resolved path of evals_file, so preparing an eval never adds files to
+    the skill (which would change its snapshot hash and its copies). It is
+    rebuilt whenever evals.json's size or modification time no longer match
+    the ones it was built from.
+    """
+    evals_file = evals_file.resolve()
+    key = hashlib.sha256(str(evals_file).encode()).hexdigest()[:32]
+    index_file = cache_dir() / EVALS_INDEX_DIRNAME / f"{key}.json"
+    st = evals_file.stat()
+    stamp = {"version": EVALS_INDEX_VERSION, "path": str(evals_file),
+             "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+    try:
+        with open(index_file) as f:
+            index = json.load(f)
+        if all(index.get(key) == value for key, value in stamp.items()):
+            return index["offsets"]
+    except (OSError, json.JSONDecodeError, AttributeError, KeyError):
+        pass
+
+    offsets = [list(span) for span in eval_byte_ranges(evals_file.read_text(encoding="utf-8"))]
+    try:
+        evals_file.with_name(LEGACY_EVALS_INDEX_FILENAME).unlink(missing_ok=True)
+    except OSError:
+        pass
+    tmp = index_file.with_name(f"{index_file.name}.{os.getpid()}.tmp")
+    try:
+        index_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp, "w") as f:
+            json.dump({**stamp, "offsets": offsets}, f, separators=(",", ":"))
+        os.replace(tmp, index_file)
+    except OSError as e:
+        print(f"  Warning: Could not write evals index {index_file}: {e}")
+    return offsets
+
+
+class LazyEvals:
+    """
+    Read-only sequence of the evals in a large evals.json.
+
+    Indexing reads and parses just that eval's byte range, found through the
+    cached index, so preparing eval N never parses the rest of the file.
+    """
+
+    def __init__(self, evals_file: Path, offsets: list[list[int]]):
+        self.evals_file = evals_file
+        self.offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def __getitem__(self, eval_id: int) -> dict:
+        start, end = self.offsets[eval_id]
+        with open(self.evals_file, "rb") as f:
+            f.seek(start)
+            return json.loads(f.read(end - start))
+
+
 def get_eval(evals: list, eval_id: int) -> dict:
     """Get a specific eval by ID (0-based index)."""
     if eval_id < 0 or eval_id >= len(evals):
@@ -106,7 +593,10 @@ def normalize_eval(eval_data: dict) -> dict:
     }
 
 
-def prepare_eval(skill_path: Path, eval_id: int, output_dir: Path, no_skill: bool = False) -> dict:
+def prepare_eval(skill_path: Path, eval_id: int, output_dir: Path, no_skill: bool = False,
+                 staging: str = "copy", evals: list | None = None, verbose: bool = True,
+                 index: EvalsIndex | None = None, store: InputStore | None = None,
+                 snapshot: Path | None = None) -> dict:
     """
     Prepare the environment for running an eval.
 
@@ -115,6 +605,13 @@ def prepare_eval(skill_path: Path, eval_id: int, output_dir: Path, no_skill: boo
         eval_id: Index of the eval in evals.json
         output_dir: Directory to prepare for the eval run
         no_skill: If True, do not copy the skill (for baseline comparison)
+        staging: "copy" or "link" (see STAGING_MODES)
+        evals: Already loaded evals, to skip re-reading evals.json
+        verbose: If False, don't report each staged file
+        index: Prebuilt EvalsIndex of the skill (built here if not given)
+        store: InputStore to stage input files through (links to shared blobs)
+        snapshot: Skill snapshot (see SkillSnapshots) to link skill/ to
+                  instead of copying the skill
 
     Returns:
         Dictionary with eval metadata
@@ -122,6 +619,9 @@ def prepare_eval(skill_path: Path, eval_id: int, output_dir: Path, no_skill: boo
     skill_path = Path(skill_path).resolve()
     output_dir = Path(output_dir).resolve()
 
+    if staging not in STAGING_MODES:
+        raise ValueError(f"Unknown staging mode: {staging} (expected one of {', '.join(STAGING_MODES)})")
+
     # Validate skill path
     if not skill_path.exists():
         raise FileNotFoundError(f"Skill directory not found: {skill_path}")
@@ -130,8 +630,11 @@ def prepare_eval(skill_path: Path, eval_id: int, output_dir: Path, no_skill: boo
     if not skill_md.exists():
         raise FileNotFoundError(f"SKILL.md not found in {skill_path}")
 
+    log = print if verbose else lambda *args: None
+
     # Load and get the specific eval
-    evals = load_evals(skill_path)
+    if evals is None:
+        evals = load_evals(skill_path)
     eval_data = get_eval(evals, eval_id)
     normalized = normalize_eval(eval_data)
 
@@ -142,25 +645,29 @@ def prepare_eval(skill_path: Path, eval_id: int, output_dir: Path, no_skill: boo
     inputs_dir = output_dir / "inputs"
     inputs_dir.mkdir(exist_ok=True)
 
+    if index is None:
+        index = EvalsIndex(skill_path)
+
     staged_files = []
+    methods = Counter()
     for file_ref in normalized["files"]:
-        # Files can be relative to skill's evals/files/ directory
-        source = skill_path / "evals" / "files" / file_ref
-        if not source.exists():
-            # Try relative to evals/ directly
-            source = skill_path / "evals" / file_ref
-        if not source.exists():
-            # Try relative to skill root
-            source = skill_path / file_ref
-
-        if source.exists():
+        # Files can be relative to evals/files/, evals/ or the skill root
+        try:
+            source = index.resolve(file_ref)
+        except ValueError as e:
+            print(f"  Warning: {e}")
+            continue
+
+        if source is not None:
             dest = inputs_dir / Path(file_ref).name
-            if source.is_file():
-                shutil.copy2(source, dest)
+            if source.is_dir():
+                stage_tree(source, dest, staging, methods, store)
+            elif store is not None:
+                methods[store.stage(source, dest)] += 1
             else:
-                shutil.copytree(source, dest, dirs_exist_ok=True)
+                methods[stage_file(source, dest, staging)] += 1
             staged_files.append(str(dest))
-            print(f"  Staged: {file_ref} -> {dest}")
+            log(f"  Staged: {file_ref} -> {dest}")
         else:
             print(f"  Warning: File not found: {file_ref}")
 
@@ -172,11 +679,19 @@ def prepare_eval(skill_path: Path, eval_id: int, output_dir: Path, no_skill: boo
     skill_copy_path = None
     if not no_skill:
         skill_copy_path = output_dir / "skill"
-        if skill_copy_path.exists():
-            shutil.rmtree(skill_copy_path)
-        shutil.copytree(skill_path, skill_copy_path, dirs_exist_ok=True)
+        if snapshot is not None:
+            reused = link_snapshot(snapshot, skill_copy_path)
+            log(f"  {'Kept' if reused else 'Linked'} skill snapshot: {skill_copy_path} -> {snapshot.name}")
+        else:
+            if skill_copy_path.exists() or skill_copy_path.is_symlink():
+                remove_path(skill_copy_path)
+            stage_tree(skill_path, skill_copy_path, staging, methods,
+                       exclude=excluded_entries(skill_path, output_dir))
+            log(f"  Copied skill to: {skill_copy_path}")
         skill_copy_path = str(skill_copy_path)
-        print(f"  Copied skill to: {skill_copy_path}")
+
+    if staging != "copy":
+        log("  Staged files: " + ", ".join(f"{count} {method}" for method, count in sorted(methods.items())))
 
     # Build metadata
     metadata = {
@@ -189,14 +704,16 @@ def prepare_eval(skill_path: Path, eval_id: int, output_dir: Path, no_skill: boo
         "inputs_dir": str(inputs_dir),
         "outputs_dir": str(outputs_dir),
         "no_skill": no_skill,
-        "original_skill_path": str(skill_path)
+        "original_skill_path": str(skill_path),
+        "staging": staging,
+        "skill_snapshot": snapshot.name if snapshot is not None and not no_skill else None
     }
 
     # Write metadata file
     metadata_path = output_dir / "eval_metadata.json"
     with open(metadata_path, "w") as f:
         json.dump(metadata, f, indent=2)
-    print(f"  Wrote: {metadata_path}")
+    log(f"  Wrote: {metadata_path}")
 
     return metadata
 
@@ -228,10 +745,147 @@ def determine_workspace(skill_path: Path) -> Path:
     return project_root / f"{skill_name}-workspace"
 
 
+def eval_number(evals: list, index: int) -> int:
+    """The N of an eval's eval-N directory: its id in evals.json, else its index."""
+    eval_id = evals[index].get("id") if isinstance(evals[index], dict) else None
+    return eval_id if isinstance(eval_id, int) else index
+
+
+def prepare_batch(skill_path: Path, benchmark_dir: Path, eval_ids: list[int] | None = None,
+                  runs: int = DEFAULT_RUNS, staging: str = "copy", jobs: int = DEFAULT_JOBS) -> dict:
+    """
+    Prepare every run of a benchmark in one call.
+
+    evals.json is loaded and the evals/ tree indexed once; each eval x
+    configuration x run directory is then prepared on a thread pool (staging
+    is dominated by file I/O). Input files are stored once per unique content
+    in <benchmark_dir>/.inputs and linked into each run, and the skill is
+    snapshotted once into <benchmark_dir>/.snapshots for all with-skill runs.
+
+    Args:
+        skill_path: Path to the skill directory
+        benchmark_dir: Benchmark directory; runs are created under runs/
+        eval_ids: Eval indexes to prepare (default: all)
+        runs: Runs per configuration
+        staging: "copy" or "link" (see STAGING_MODES)
+        jobs: Worker threads
+
+    Returns:
+        The manifest written to <benchmark_dir>/eval_manifest.json
+    """
+    skill_path = Path(skill_path).resolve()
+    benchmark_dir = Path(benchmark_dir).resolve()
+    evals = load_evals(skill_path, lazy=False)
+    if eval_ids is None:
+        eval_ids = list(range(len(evals)))
+    for eval_id in eval_ids:
+        get_eval(evals, eval_id)  # fail before preparing anything
+    # Runs are placed by eval id, so two evals sharing one would overwrite each other
+    numbers = Counter(eval_number(evals, eval_id) for eval_id in eval_ids)
+    duplicates = sorted(number for number, count in numbers.items() if count > 1)
+    if duplicates:
+        raise ValueError(f"Duplicate eval id(s) {', '.join(map(str, duplicates))}: "
+                         "each eval needs its own runs/eval-<id> directory")
+    index = EvalsIndex(skill_path)
+    store = InputStore(benchmark_dir / INPUT_STORE_DIRNAME)
+    snapshots = SkillSnapshots(benchmark_dir / SNAPSHOT_STORE_DIRNAME)
+    snapshot = snapshots.snapshot(skill_path, excluded_entries(skill_path, benchmark_dir))
+
+    tasks = [
+        (eval_id, configuration, run_number,
+         benchmark_dir / "runs" / f"eval-{eval_number(evals, eval_id)}" / configuration / f"run-{run_number}")
+        for eval_id in eval_ids
+        for configuration in BATCH_CONFIGURATIONS
+        for run_number in range(1, runs + 1)
+    ]
+
+    def prepare(task):
+        eval_id, configuration, _, run_dir = task
+        return prepare_eval(skill_path, eval_id, run_dir, no_skill=configuration == "without_skill",
+                            staging=staging, evals=evals, verbose=False, index=index, store=store,
+                            snapshot=snapshot)
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        prepared = list(executor.map(prepare, tasks))
+
+    manifest = {
+        "skill_path": str(skill_path),
+        "staging": staging,
+        "configurations": list(BATCH_CONFIGURATIONS),
+        "runs_per_configuration": runs,
+        "evals_run": sorted({eval_number(evals, eval_id) for eval_id in eval_ids}),
+        "runs": [
+            {
+                "eval_id": eval_number(evals, eval_id),
+                "eval_index": eval_id,
+                "configuration": configuration,
+                "run_number": run_number,
+                "run_dir": str(run_dir.relative_to(benchmark_dir)),
+                "input_files": len(metadata["input_files"])
+            }
+            for (eval_id, configuration, run_number, run_dir), metadata in zip(tasks, prepared)
+        ]
+    }
+
+    manifest_path = benchmark_dir / MANIFEST_FILENAME
+    with open(manifest_path, "w") as f:
+        json.dump(manifest, f, indent=2)
+
+    return manifest
+
+
+def flag_value(args: list[str], flag: str) -> str | None:
+    """Return the value following flag in args, None if the flag is absent."""
+    if flag not in args:
+        return None
+    idx = args.index(flag)
+    if idx + 1 >= len(args):
+        print(f"Error: {flag} requires a value")
+        sys.exit(1)
+    return args[idx + 1]
+
+
+def batch_main(args: list[str]) -> None:
+    """Handle prepare_eval.py <skill-path> --all ..."""
+    skill_path = Path(args[0])
+    output_dir = flag_value(args, "--output-dir")
+    staging = flag_value(args, "--staging") or "copy"
+    if staging not in STAGING_MODES:
+        print(f"Error: --staging requires one of: {', '.join(STAGING_MODES)}")
+        sys.exit(1)
+
+    try:
+        evals_arg = flag_value(args, "--evals")
+        eval_ids = [int(part) for part in evals_arg.split(",")] if evals_arg else None
+        runs = int(flag_value(args, "--runs") or DEFAULT_RUNS)
+        jobs = int(flag_value(args, "--jobs") or DEFAULT_JOBS)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    print(f"Preparing benchmark runs for skill: {skill_path}")
+    print(f"Output directory: {output_dir}")
+    print()
+
+    try:
+        manifest = prepare_batch(skill_path, Path(output_dir), eval_ids, runs, staging, jobs)
+    except Exception as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    print(f"Prepared {len(manifest['runs'])} run(s): {len(manifest['evals_run'])} eval(s) x "
+          f"{len(manifest['configurations'])} configuration(s) x {runs} run(s)")
+    print(f"  Wrote: {Path(output_dir) / MANIFEST_FILENAME}")
+
+
 def main():
     # Parse arguments
     args = sys.argv[1:]
 
+    if "--all" in args and "--output-dir" in args and len(args) >= 4:
+        batch_main(args)
+        return
+
     if len(args) < 4 or "--output-dir" not in args:
         print(__doc__)
         sys.exit(1)
@@ -248,6 +902,17 @@ def main():
         sys.exit(1)
     output_dir = args[output_dir_idx + 1]
 
+    staging = "copy"
+    if "--staging" in args:
+        staging_idx = args.index("--staging")
+        if staging_idx + 1 >= len(args) or args[staging_idx + 1] not in STAGING_MODES:
+            print(f"Error: --staging requires one of: {', '.join(STAGING_MODES)}")
+            sys.exit(1)
+        staging = args[staging_idx + 1]
+
+    input_store = flag_value(args, "--input-store")
+    snapshot_store = flag_value(args, "--snapshot-store")
+
     print(f"Preparing eval {eval_id} for skill: {skill_path}")
     print(f"Output directory: {output_dir}")
     if no_skill:
@@ -257,11 +922,22 @@ def main():
     print()
 
     try:
+        snapshot = None
+        if snapshot_store and not no_skill:
+            snapshots = SkillSnapshots(Path(snapshot_store))
+            resolved_skill = Path(skill_path).resolve()
+            snapshot = snapshots.snapshot(
+                resolved_skill, excluded_entries(resolved_skill, Path(output_dir), snapshots.root)
+            )
+
         metadata = prepare_eval(
             skill_path=Path(skill_path),
             eval_id=eval_id,
             output_dir=Path(output_dir),
-            no_skill=no_skill
+            no_skill=no_skill,
+            staging=staging,
+            store=InputStore(Path(input_store)) if input_store else None,
+            snapshot=snapshot
         )
 
         print()
@@ -9,8 +9,25 @@ import re
 import yaml
 from pathlib import Path
 
-def validate_skill(skill_path):
-    """Basic validation of a skill"""
+from validation_cache import ValidationCache, file_digest, source_fingerprint
+
+CACHE_NAME = 'quick_validate'
+
+def cache_key(cache, skill_md):
+    """Key a SKILL.md's verdict by its content and this script's source (None if unreadable)"""
+    digest = file_digest(skill_md)
+    if not digest:
+        return None
+    return cache.key(CACHE_NAME, source_fingerprint(__file__), digest)
+
+def validate_skill(skill_path, use_cache=True, cache=None):
+    """Basic validation of a skill
+
+    Verdicts are cached by SKILL.md content (and this script's source), so
+    an unchanged skill is not re-parsed. To validate many skills, pass one
+    shared ValidationCache(CACHE_NAME) as cache and save() it afterwards;
+    otherwise the cache is loaded per call and saved when a verdict is added.
+    """
     skill_path = Path(skill_path)
 
     # Check SKILL.md exists
@@ -18,7 +35,24 @@ def validate_skill(skill_path):
     if not skill_md.exists():
         return False, "SKILL.md not found"
 
-    # Read and validate frontmatter
+    if use_cache:
+        shared = cache is not None
+        if not shared:
+            cache = ValidationCache(CACHE_NAME)
+        key = cache_key(cache, skill_md)
+        if key:
+            cached = cache.get(key)
+            if cached is None:
+                cached = validate_skill_md(skill_md)
+                cache.put(key, list(cached))
+                if not shared:
+                    cache.save()
+            return cached[0], cached[1]
+
+    return validate_skill_md(skill_md)
+
+def validate_skill_md(skill_md):
+    """Validate the frontmatter of a SKILL.md file"""
     content = skill_md.read_text()
     if not content.startswith('---'):
         return False, "No YAML frontmatter found"
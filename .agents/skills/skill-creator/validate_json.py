@@ -14,82 +14,193 @@ Supports validation for:
 
 Usage:
     python validate_json.py <file_path> [--type <type>]
+    python validate_json.py <directory> [--type <type>] [--jobs N]
+    (either form also takes --stream/--no-stream, --fail-fast and --no-cache)
 
 Examples:
     python validate_json.py workspace/benchmark.json
     python validate_json.py evals/evals.json --type evals
     python validate_json.py run-1/grading.json --type grading
+    python validate_json.py workspace/benchmarks/2026-01-15/
+
+Given a directory, every JSON file under it whose type can be inferred from
+its name is validated across a process pool, and one report is printed.
+A benchmark.json with a runs/ directory beside it is also cross-checked
+against the run directories on disk.
+
+Very large files are parsed incrementally: items of top-level arrays such as
+benchmark runs or grading expectations are validated as they are read, so the
+whole document is never held in memory.
 """
 
 import argparse
 import json
+import os
+import re
 import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Any
 
+from validation_cache import ValidationCache, file_digest, source_fingerprint
 
-# Schema definitions as validation rules
+
+# Schema definitions as validation rules.
+#
+# Each entry describes an object: "required" keys, "optional" keys (for
+# reference only), "any_of" (at least one must be present) and per-key
+# "fields" specs. A field spec may set "type" (see TYPE_NAMES), "range",
+# "enum", "items" (spec for list elements) and, for objects, the same keys as
+# an entry plus "values"/"exclude" (spec for every value of a mapping, minus
+# the excluded keys). Fields are only checked when present. Entries are
+# compiled into checkers once at import; see compile_schema().
 SCHEMAS = {
     "evals": {
         "required": ["skill_name", "evals"],
-        "evals_item": {
-            "required": ["id", "prompt"],
-            "optional": ["expected_output", "files", "expectations"]
+        "fields": {
+            "evals": {
+                "type": "list",
+                "items": {
+                    "required": ["id", "prompt"],
+                    "optional": ["expected_output", "files", "expectations"],
+                    "fields": {
+                        "id": {"type": "integer"},
+                        "expectations": {"type": "list", "items": {"type": "string"}},
+                    }
+                }
+            }
         }
     },
     "grading": {
         "required": ["expectations", "summary"],
-        "summary": {
-            "required": ["passed", "failed", "total", "pass_rate"]
-        },
-        "expectations_item": {
-            "required": ["text", "passed", "evidence"]
+        "fields": {
+            "summary": {
+                "required": ["passed", "failed", "total", "pass_rate"],
+                "fields": {
+                    "pass_rate": {"type": "number", "range": [0, 1]}
+                }
+            },
+            "expectations": {
+                "type": "list",
+                "items": {
+                    "required": ["text", "passed", "evidence"],
+                    "fields": {
+                        "passed": {"type": "boolean"}
+                    }
+                }
+            }
         }
     },
     "benchmark": {
         "required": ["metadata", "runs", "run_summary"],
-        "metadata": {
-            "required": ["skill_name", "timestamp", "runs_per_configuration"]
+        "fields": {
+            "metadata": {
+                "required": ["skill_name", "timestamp", "runs_per_configuration"],
+                "fields": {
+                    "configurations": {"type": "list", "items": {"type": "string"}},
+                    "baseline": {"type": "string"}
+                }
+            },
+            "runs": {
+                "type": "list",
+                "items": {
+                    "required": ["eval_id", "configuration", "run_number", "result"]
+                }
+            },
+            "run_summary": {
+                "type": "object",
+                "values": {
+                    "required": ["pass_rate", "time_seconds", "tokens"]
+                },
+                # run_summary keys that are not configurations
+                "exclude": ["delta", "deltas", "significance"]
+            }
         },
-        "runs_item": {
-            "required": ["eval_id", "configuration", "run_number", "result"]
-        },
-        "run_summary_config": {
-            "required": ["pass_rate", "time_seconds", "tokens"]
-        }
+        # Used when metadata doesn't list its configurations
+        "default_configurations": ["with_skill", "without_skill"]
     },
     "metrics": {
         "required": ["tool_calls", "total_tool_calls"],
         "optional": ["total_steps", "files_created", "errors_encountered",
-                     "output_chars", "transcript_chars"]
+                     "output_chars", "transcript_chars"],
+        "fields": {
+            "tool_calls": {"type": "object"},
+            "total_tool_calls": {"type": "integer"}
+        }
     },
     "timing": {
-        "required": [],  # All fields optional but should have at least one
+        "required": [],
         "optional": ["executor_start", "executor_end", "executor_duration_seconds",
                      "grader_start", "grader_end", "grader_duration_seconds",
-                     "total_duration_seconds"]
+                     "total_duration_seconds"],
+        # All fields optional but should have at least one
+        "any_of": ["executor_start", "executor_end", "executor_duration_seconds",
+                   "grader_start", "grader_end", "grader_duration_seconds",
+                   "total_duration_seconds"],
+        "fields": {
+            "executor_duration_seconds": {"type": "number"},
+            "grader_duration_seconds": {"type": "number"},
+            "total_duration_seconds": {"type": "number"}
+        }
     },
     "history": {
         "required": ["started_at", "skill_name", "current_best", "iterations"],
-        "iterations_item": {
-            "required": ["version", "expectation_pass_rate", "grading_result", "is_current_best"]
+        "fields": {
+            "iterations": {
+                "type": "list",
+                "items": {
+                    "required": ["version", "expectation_pass_rate", "grading_result", "is_current_best"],
+                    "fields": {
+                        "grading_result": {"enum": ["baseline", "won", "lost", "tie"]}
+                    }
+                }
+            }
         }
     },
     "comparison": {
         "required": ["winner", "reasoning", "rubric", "output_quality"],
-        "rubric_side": {
-            "required": ["content", "structure", "overall_score"]
+        "fields": {
+            "winner": {"enum": ["A", "B", "TIE"]},
+            "rubric": {
+                "fields": {
+                    "A": {"required": ["content", "structure", "overall_score"]},
+                    "B": {"required": ["content", "structure", "overall_score"]}
+                }
+            }
         }
     },
     "analysis": {
         "required": ["comparison_summary", "winner_strengths", "loser_weaknesses",
                      "improvement_suggestions"],
-        "improvement_item": {
-            "required": ["priority", "category", "suggestion"]
+        "fields": {
+            "improvement_suggestions": {
+                "type": "list",
+                "items": {
+                    "required": ["priority", "category", "suggestion"],
+                    "fields": {
+                        "priority": {"enum": ["high", "medium", "low"]}
+                    }
+                }
+            }
         }
     }
 }
 
+# Field "type" -> (isinstance check, description used in error messages)
+TYPE_NAMES = {
+    "object": (dict, "an object"),
+    "list": (list, "a list"),
+    "string": (str, "a string"),
+    "integer": (int, "an integer"),
+    "number": ((int, float), "a number"),
+    "boolean": (bool, "a boolean"),
+}
+
+# Spec keys that make a field an object with its own keys to check
+OBJECT_KEYS = ("required", "any_of", "fields", "values")
+
 
 def infer_type(file_path: Path) -> str | None:
     """Infer JSON type from filename."""
@@ -115,241 +226,457 @@ def infer_type(file_path: Path) -> str | None:
     return None
 
 
-def validate_required_fields(data: dict, required: list[str], path: str = "") -> list[str]:
-    """Check that all required fields are present."""
-    errors = []
-    for field in required:
-        if field not in data:
-            errors.append(f"{path}Missing required field: {field}")
+# Compiled checkers take a value and return a list of (path, error) pairs, or
+# None when the value is valid. Paths are lists of segments collected in
+# reverse ("[3]", "id", ...) so that locations are only built for errors.
+
+def format_error(path: list[str], error: str) -> str:
+    """Render a (reversed path, error) pair in the validator's message style."""
+    location = ""
+    for segment in reversed(path):
+        if location and not segment.startswith("["):
+            location += "."
+        location += segment
+    if error.startswith("Missing required field") or error.startswith("Should have"):
+        return f"{location}: {error}" if location else error
+    if not location:
+        location = "Document"
+    elif len(path) == 1 and not location.startswith("["):
+        location = f"'{location}'"
+    return f"{location} {error}"
+
+
+def prefix_errors(errors: list, segment: str) -> list:
+    """Prepend a path segment to every error from a nested checker."""
+    for path, _ in errors:
+        path.append(segment)
     return errors
 
 
-def validate_evals(data: dict) -> list[str]:
-    """Validate evals.json structure."""
-    errors = validate_required_fields(data, SCHEMAS["evals"]["required"])
-
-    if "evals" in data:
-        if not isinstance(data["evals"], list):
-            errors.append("'evals' must be a list")
-        else:
-            for i, eval_item in enumerate(data["evals"]):
-                item_errors = validate_required_fields(
-                    eval_item,
-                    SCHEMAS["evals"]["evals_item"]["required"],
-                    f"evals[{i}]: "
-                )
-                errors.extend(item_errors)
-
-                # Validate id is an integer
-                if "id" in eval_item and not isinstance(eval_item["id"], int):
-                    errors.append(f"evals[{i}]: 'id' must be an integer")
-
-                # Validate expectations is a list of strings
-                if "expectations" in eval_item:
-                    if not isinstance(eval_item["expectations"], list):
-                        errors.append(f"evals[{i}]: 'expectations' must be a list")
-                    else:
-                        for j, exp in enumerate(eval_item["expectations"]):
-                            if not isinstance(exp, str):
-                                errors.append(f"evals[{i}].expectations[{j}]: must be a string")
+def compile_object(spec: dict):
+    """Compile the object-level parts of a spec (keys and nested fields)."""
+    required = tuple(spec.get("required", ()))
+    required_set = frozenset(required)
+    any_of = frozenset(spec.get("any_of", ()))
+    any_of_error = f"Should have at least one of: {', '.join(spec.get('any_of', ()))}"
+    fields = tuple((name, compile_field(field_spec))
+                   for name, field_spec in spec.get("fields", {}).items())
+    values = compile_field(spec["values"]) if "values" in spec else None
+    exclude = frozenset(spec.get("exclude", ()))
+
+    if not any_of and not fields and values is None:
+        # Only required keys: a single subset test per object
+        def check_required(data):
+            if not isinstance(data, dict):
+                return [([], "must be an object")]
+            if required_set <= data.keys():
+                return None
+            return [([], f"Missing required field: {field}")
+                    for field in required if field not in data]
+
+        return check_required
+
+    def check(data):
+        if not isinstance(data, dict):
+            return [([], "must be an object")]
+        errors = None
+        keys = data.keys()
+        if not required_set <= keys:
+            errors = [([], f"Missing required field: {field}")
+                      for field in required if field not in data]
+        if any_of and any_of.isdisjoint(keys):
+            errors = (errors or []) + [([], any_of_error)]
+        for name, check_field in fields:
+            if name in data:
+                field_errors = check_field(data[name])
+                if field_errors:
+                    errors = (errors or []) + prefix_errors(field_errors, name)
+        if values is not None:
+            for name, value in data.items():
+                if name in exclude:
+                    continue
+                value_errors = values(value)
+                if value_errors:
+                    errors = (errors or []) + prefix_errors(value_errors, name)
+        return errors
+
+    return check
+
+
+def compile_field(spec: dict):
+    """Compile a field spec into a checker with its type and nested checks bound."""
+    expected, description = TYPE_NAMES.get(spec.get("type"), (None, None))
+    if "range" in spec:
+        low, high = spec["range"]
+        description = f"{description or 'a value'} between {low} and {high}"
+    else:
+        low = high = None
+    enum = spec.get("enum")
+    enum_set = frozenset(enum) if enum is not None else None
+    items = compile_field(spec["items"]) if "items" in spec else None
+    nested = compile_object(spec) if any(key in spec for key in OBJECT_KEYS) else None
+
+    # Plain objects (the common case for list items) need no wrapper
+    if nested is not None and spec.get("type", "object") == "object" and low is None \
+            and enum is None and items is None:
+        return nested
+
+    def check(value):
+        if expected is not None and not isinstance(value, expected):
+            return [([], f"must be {description}")]
+        if low is not None and not low <= value <= high:
+            return [([], f"must be {description}")]
+        if enum_set is not None and value not in enum_set:
+            return [([], f"must be one of: {enum}")]
+        errors = nested(value) if nested is not None else None
+        if items is not None:
+            for i, item in enumerate(value):
+                item_errors = items(item)
+                if item_errors:
+                    errors = (errors or []) + prefix_errors(item_errors, f"[{i}]")
+        return errors
+
+    return check
+
+
+def compile_schema(spec: dict):
+    """Compile a SCHEMAS entry into a validator returning a list of error strings."""
+    check = compile_object(spec)
+
+    def validate(data) -> list[str]:
+        errors = check(data)
+        return [format_error(path, error) for path, error in errors] if errors else []
+
+    return validate
+
+
+def check_benchmark_configurations(data: dict) -> list[str]:
+    """Check runs and run_summary against the benchmark's own configurations.
+
+    Configurations are discovered per benchmark (e.g. v0..vN), so which
+    values are allowed depends on the document's metadata rather than the
+    schema.
+    """
+    errors = []
+    configurations = SCHEMAS["benchmark"]["default_configurations"]
+    metadata = data.get("metadata")
+
+    if isinstance(metadata, dict) and "configurations" in metadata:
+        configurations = metadata["configurations"]
+        if not isinstance(configurations, list) or not all(isinstance(c, str) and c for c in configurations):
+            errors.append("metadata.configurations must be a list of non-empty strings")
+            return errors
+        if metadata.get("baseline", configurations[0] if configurations else None) not in configurations:
+            errors.append("metadata.baseline must be one of metadata.configurations")
+
+    allowed = frozenset(configurations)
+    runs = data.get("runs")
+    if isinstance(runs, (list, StreamedArray)):
+        for i, run in enumerate(runs):
+            if isinstance(run, dict) and "configuration" in run and run["configuration"] not in allowed:
+                errors.append(f"runs[{i}].configuration must be one of: {configurations}")
+
+    run_summary = data.get("run_summary")
+    if isinstance(run_summary, dict):
+        reserved = SCHEMAS["benchmark"]["fields"]["run_summary"]["exclude"]
+        for config in run_summary:
+            if config not in reserved and config not in allowed:
+                errors.append(f"run_summary.{config}: not one of the benchmark's configurations")
 
     return errors
 
 
-def validate_grading(data: dict) -> list[str]:
-    """Validate grading.json structure."""
-    errors = validate_required_fields(data, SCHEMAS["grading"]["required"])
+# Checks that depend on values elsewhere in the document, run after the
+# compiled schema for their type
+CROSS_FIELD_CHECKS = {
+    "benchmark": [check_benchmark_configurations],
+}
 
-    if "summary" in data:
-        summary_errors = validate_required_fields(
-            data["summary"],
-            SCHEMAS["grading"]["summary"]["required"],
-            "summary: "
-        )
-        errors.extend(summary_errors)
 
-        # Validate pass_rate is between 0 and 1
-        if "pass_rate" in data["summary"]:
-            pr = data["summary"]["pass_rate"]
-            if not isinstance(pr, (int, float)) or pr < 0 or pr > 1:
-                errors.append("summary.pass_rate must be a number between 0 and 1")
+def build_validator(json_type: str):
+    """Combine the compiled schema for a type with its cross-field checks."""
+    validate_schema = SCHEMA_VALIDATORS[json_type]
+    extra_checks = CROSS_FIELD_CHECKS.get(json_type, [])
+    if not extra_checks:
+        return validate_schema
 
-    if "expectations" in data:
-        if not isinstance(data["expectations"], list):
-            errors.append("'expectations' must be a list")
-        else:
-            for i, exp in enumerate(data["expectations"]):
-                exp_errors = validate_required_fields(
-                    exp,
-                    SCHEMAS["grading"]["expectations_item"]["required"],
-                    f"expectations[{i}]: "
-                )
-                errors.extend(exp_errors)
+    def validate(data) -> list[str]:
+        errors = validate_schema(data)
+        if isinstance(data, dict):
+            for extra_check in extra_checks:
+                errors.extend(extra_check(data))
+        return errors
 
-                if "passed" in exp and not isinstance(exp["passed"], bool):
-                    errors.append(f"expectations[{i}].passed must be a boolean")
+    return validate
 
-    return errors
 
+SCHEMA_VALIDATORS = {json_type: compile_schema(spec) for json_type, spec in SCHEMAS.items()}
+VALIDATORS = {json_type: build_validator(json_type) for json_type in SCHEMAS}
 
-def validate_benchmark(data: dict) -> list[str]:
-    """Validate benchmark.json structure."""
-    errors = validate_required_fields(data, SCHEMAS["benchmark"]["required"])
+# Top-level arrays whose items are validated one at a time when streaming
+STREAMED_ITEMS = {
+    json_type: {
+        name: compile_field(field_spec["items"])
+        for name, field_spec in spec.get("fields", {}).items()
+        if field_spec.get("type") == "list" and "items" in field_spec
+    }
+    for json_type, spec in SCHEMAS.items()
+}
 
-    if "metadata" in data:
-        meta_errors = validate_required_fields(
-            data["metadata"],
-            SCHEMAS["benchmark"]["metadata"]["required"],
-            "metadata: "
-        )
-        errors.extend(meta_errors)
+# Files at least this large are validated with the streaming parser
+STREAM_THRESHOLD_BYTES = 64 * 1024 * 1024
+STREAM_CHUNK_SIZE = 1 << 16
+# A decode error this close to the end of the buffer may be a token cut off
+# by the chunk boundary ("tru", "1.", "\\u00"); anything earlier is a syntax error
+TRUNCATION_MARGIN = 8
+WHITESPACE = re.compile(r"[ \t\n\r]*")
 
-    if "runs" in data:
-        if not isinstance(data["runs"], list):
-            errors.append("'runs' must be a list")
-        else:
-            for i, run in enumerate(data["runs"]):
-                run_errors = validate_required_fields(
-                    run,
-                    SCHEMAS["benchmark"]["runs_item"]["required"],
-                    f"runs[{i}]: "
-                )
-                errors.extend(run_errors)
-
-                # Validate configuration
-                if "configuration" in run:
-                    if run["configuration"] not in ["with_skill", "without_skill"]:
-                        errors.append(f"runs[{i}].configuration must be 'with_skill' or 'without_skill'")
-
-    if "run_summary" in data:
-        for config in ["with_skill", "without_skill"]:
-            if config in data["run_summary"]:
-                config_errors = validate_required_fields(
-                    data["run_summary"][config],
-                    SCHEMAS["benchmark"]["run_summary_config"]["required"],
-                    f"run_summary.{config}: "
-                )
-                errors.extend(config_errors)
 
-    return errors
+class JSONStreamReader:
+    """
+    Incremental reader for a JSON document in a text file.
 
+    Only a window of the file is held in memory: each value() call decodes
+    the next complete value with raw_decode, reading more of the file while
+    the value is still incomplete. Each retry reads as much again as is
+    already pending, so a value of n characters is decoded in O(n) overall.
+    """
 
-def validate_metrics(data: dict) -> list[str]:
-    """Validate metrics.json structure."""
-    errors = validate_required_fields(data, SCHEMAS["metrics"]["required"])
+    def __init__(self, f):
+        self.f = f
+        self.buffer = ""
+        self.pos = 0
+        self.offset = 0  # characters dropped from the front of the buffer
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def fill(self, size: int = STREAM_CHUNK_SIZE) -> bool:
+        """Read up to size more characters, discarding consumed input. False at end of file."""
+        chunk = self.f.read(size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.offset += self.pos
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def error(self, message: str, pos: int | None = None) -> ValueError:
+        """Build a parse error located by its offset in the whole file."""
+        position = self.offset + (self.pos if pos is None else pos)
+        return ValueError(f"{message} (char {position})")
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it ("" at EOF)."""
+        while True:
+            self.pos = WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer) or not self.fill():
+                return self.buffer[self.pos:self.pos + 1]
+
+    def take(self) -> str:
+        """Consume and return the next non-whitespace character."""
+        char = self.peek()
+        self.pos += len(char)
+        return char
+
+    def expect(self, expected: str) -> None:
+        if self.take() != expected:
+            raise self.error(f"Expecting '{expected}'", self.pos - 1)
+
+    def truncated(self, error: json.JSONDecodeError) -> bool:
+        """Whether a decode error may only mean the value continues past the buffer."""
+        return (error.pos >= len(self.buffer) - TRUNCATION_MARGIN
+                or error.msg.startswith("Unterminated string"))
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value, raising at the first syntax error."""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError as e:
+                pending = len(self.buffer) - self.pos
+                if self.truncated(e) and self.fill(max(STREAM_CHUNK_SIZE, pending)):
+                    continue
+                raise self.error(e.msg, e.pos) from None
+            # A number ending the buffer may continue in the next chunk
+            if end == len(self.buffer) and isinstance(value, (int, float)) and not self.eof \
+                    and self.fill():
+                continue
+            self.pos = end
+            return value
+
+
+# Marks the end of a streamed array in iter_members() output
+STREAMED = object()
+
+
+def iter_members(reader: JSONStreamReader):
+    """
+    Yield (key, index, value) for each member of a top-level JSON object.
 
-    if "tool_calls" in data and not isinstance(data["tool_calls"], dict):
-        errors.append("'tool_calls' must be an object")
+    Array members are yielded item by item with their index, then once more
+    as (key, None, STREAMED), so no array is ever decoded whole; every other
+    member is yielded whole with index None.
+    """
+    if reader.peek() != "{":
+        raise reader.error("Top-level value must be an object")
+    reader.take()
+    if reader.peek() == "}":
+        reader.take()
+    else:
+        while True:
+            key = reader.value()
+            if not isinstance(key, str):
+                raise reader.error("Expecting property name")
+            reader.expect(":")
+            if reader.peek() == "[":
+                reader.take()
+                if reader.peek() == "]":
+                    reader.take()
+                else:
+                    index = 0
+                    while True:
+                        yield key, index, reader.value()
+                        index += 1
+                        separator = reader.take()
+                        if separator == "]":
+                            break
+                        if separator != ",":
+                            raise reader.error("Expecting ',' delimiter", reader.pos - 1)
+                yield key, None, STREAMED
+            else:
+                yield key, None, reader.value()
+            separator = reader.take()
+            if separator == "}":
+                break
+            if separator != ",":
+                raise reader.error("Expecting ',' delimiter", reader.pos - 1)
+    if reader.peek():
+        raise reader.error("Extra data")
+
+
+class StreamedArray:
+    """
+    Re-readable view of a top-level array in a JSON file.
 
-    if "total_tool_calls" in data and not isinstance(data["total_tool_calls"], int):
-        errors.append("'total_tool_calls' must be an integer")
+    Cross-field checks iterate it like a list; each iteration parses the
+    file again item by item instead of keeping the array in memory.
+    """
 
-    return errors
+    def __init__(self, file_path: Path, key: str):
+        self.file_path = file_path
+        self.key = key
 
+    def __iter__(self):
+        with open(self.file_path) as f:
+            for key, index, value in iter_members(JSONStreamReader(f)):
+                if key == self.key and index is not None:
+                    yield value
 
-def validate_timing(data: dict) -> list[str]:
-    """Validate timing.json structure."""
-    errors = []
 
-    # At least one timing field should be present
-    timing_fields = SCHEMAS["timing"]["optional"]
-    has_timing = any(field in data for field in timing_fields)
+def validate_stream(file_path: Path, json_type: str, fail_fast: bool = False) -> list[str]:
+    """
+    Validate a JSON file without loading it whole.
 
-    if not has_timing:
-        errors.append("timing.json should have at least one timing field")
+    Every top-level array is read item by item: items of the type's
+    declared lists (runs, expectations, ...) are checked as they are parsed
+    and the rest are skipped, so memory is bounded by the largest item. The
+    remaining members are small and are checked once the object closes.
+    """
+    item_checks = STREAMED_ITEMS[json_type]
+    document = {}
+    streamed = []
+    errors = []
 
-    # Validate duration fields are numbers
-    for field in ["executor_duration_seconds", "grader_duration_seconds", "total_duration_seconds"]:
-        if field in data and not isinstance(data[field], (int, float)):
-            errors.append(f"'{field}' must be a number")
+    try:
+        with open(file_path) as f:
+            for key, index, value in iter_members(JSONStreamReader(f)):
+                if index is None:
+                    if value is STREAMED:
+                        streamed.append(key)
+                        value = []
+                    document[key] = value
+                    continue
+                if key not in item_checks:
+                    continue
+                item_errors = item_checks[key](value)
+                if item_errors:
+                    errors.extend(format_error(path + [f"[{index}]", key], error)
+                                  for path, error in item_errors)
+                    if fail_fast:
+                        return errors[:1]
+    except ValueError as e:
+        return errors + [f"Invalid JSON: {e}"]
+
+    # Streamed arrays stand in as empty lists for the shape checks
+    errors.extend(SCHEMA_VALIDATORS[json_type](document))
+    if errors and fail_fast:
+        return errors[:1]
+
+    for key in streamed:
+        document[key] = StreamedArray(file_path, key)
+    for extra_check in CROSS_FIELD_CHECKS.get(json_type, []):
+        errors.extend(extra_check(document))
+        if errors and fail_fast:
+            return errors[:1]
 
     return errors
 
 
-def validate_history(data: dict) -> list[str]:
-    """Validate history.json structure."""
-    errors = validate_required_fields(data, SCHEMAS["history"]["required"])
-
-    if "iterations" in data:
-        if not isinstance(data["iterations"], list):
-            errors.append("'iterations' must be a list")
-        else:
-            for i, iteration in enumerate(data["iterations"]):
-                iter_errors = validate_required_fields(
-                    iteration,
-                    SCHEMAS["history"]["iterations_item"]["required"],
-                    f"iterations[{i}]: "
-                )
-                errors.extend(iter_errors)
-
-                if "grading_result" in iteration:
-                    valid_results = ["baseline", "won", "lost", "tie"]
-                    if iteration["grading_result"] not in valid_results:
-                        errors.append(f"iterations[{i}].grading_result must be one of: {valid_results}")
-
-    return errors
+@lru_cache(maxsize=None)
+def schema_fingerprint() -> str:
+    """Fingerprint of this module, which holds SCHEMAS and every check."""
+    return source_fingerprint(__file__)
 
 
-def validate_comparison(data: dict) -> list[str]:
-    """Validate comparison.json structure."""
-    errors = validate_required_fields(data, SCHEMAS["comparison"]["required"])
+CACHE_NAME = "validate_json"
 
-    if "winner" in data:
-        if data["winner"] not in ["A", "B", "TIE"]:
-            errors.append("'winner' must be 'A', 'B', or 'TIE'")
 
-    if "rubric" in data:
-        for side in ["A", "B"]:
-            if side in data["rubric"]:
-                side_errors = validate_required_fields(
-                    data["rubric"][side],
-                    SCHEMAS["comparison"]["rubric_side"]["required"],
-                    f"rubric.{side}: "
-                )
-                errors.extend(side_errors)
+def cache_key(file_path: Path, json_type: str, fail_fast: bool) -> str | None:
+    """Key a file's verdict by its content and the current schemas (None if unreadable)."""
+    digest = file_digest(file_path)
+    if digest is None:
+        return None
+    return ValidationCache.key(CACHE_NAME, schema_fingerprint(), digest, json_type, fail_fast)
 
-    return errors
 
+# Cache keys that already have a verdict, set in each tree-mode worker
+KNOWN_KEYS = None
 
-def validate_analysis(data: dict) -> list[str]:
-    """Validate analysis.json structure."""
-    errors = validate_required_fields(data, SCHEMAS["analysis"]["required"])
 
-    if "improvement_suggestions" in data:
-        if not isinstance(data["improvement_suggestions"], list):
-            errors.append("'improvement_suggestions' must be a list")
-        else:
-            for i, suggestion in enumerate(data["improvement_suggestions"]):
-                sugg_errors = validate_required_fields(
-                    suggestion,
-                    SCHEMAS["analysis"]["improvement_item"]["required"],
-                    f"improvement_suggestions[{i}]: "
-                )
-                errors.extend(sugg_errors)
-
-                if "priority" in suggestion:
-                    if suggestion["priority"] not in ["high", "medium", "low"]:
-                        errors.append(f"improvement_suggestions[{i}].priority must be 'high', 'medium', or 'low'")
+def set_known_keys(keys: frozenset | None) -> None:
+    global KNOWN_KEYS
+    KNOWN_KEYS = keys
 
-    return errors
 
+def validate_uncached(file_path: Path, json_type: str, stream: bool | None,
+                      fail_fast: bool) -> tuple[str | None, tuple[bool, list[str]] | None]:
+    """
+    Tree-mode worker: hash a file and validate it unless KNOWN_KEYS has its key.
 
-VALIDATORS = {
-    "evals": validate_evals,
-    "grading": validate_grading,
-    "benchmark": validate_benchmark,
-    "metrics": validate_metrics,
-    "timing": validate_timing,
-    "history": validate_history,
-    "comparison": validate_comparison,
-    "analysis": validate_analysis,
-}
+    Returns (cache key, verdict); the verdict is None when the caller's cache
+    already holds it, and the key is None when caching is off.
+    """
+    key = None
+    if KNOWN_KEYS is not None:
+        key = cache_key(file_path, json_type, fail_fast)
+        if key in KNOWN_KEYS:
+            return key, None
+    return key, validate_file(file_path, json_type, stream, fail_fast)
 
 
-def validate_file(file_path: Path, json_type: str | None = None) -> tuple[bool, list[str]]:
+def validate_file(file_path: Path, json_type: str | None = None,
+                  stream: bool | None = None, fail_fast: bool = False,
+                  cache: ValidationCache | None = None) -> tuple[bool, list[str]]:
     """
     Validate a JSON file.
 
+    Files of STREAM_THRESHOLD_BYTES or more are validated incrementally
+    unless stream says otherwise. With fail_fast, only the first error is
+    returned. With a cache, an unchanged file gets its previous verdict
+    without being parsed.
+
     Returns (is_valid, errors) tuple.
     """
     errors = []
@@ -358,13 +685,6 @@ def validate_file(file_path: Path, json_type: str | None = None) -> tuple[bool,
     if not file_path.exists():
         return False, [f"File not found: {file_path}"]
 
-    # Load JSON
-    try:
-        with open(file_path) as f:
-            data = json.load(f)
-    except json.JSONDecodeError as e:
-        return False, [f"Invalid JSON: {e}"]
-
     # Infer type if not provided
     if json_type is None:
         json_type = infer_type(file_path)
@@ -375,27 +695,326 @@ def validate_file(file_path: Path, json_type: str | None = None) -> tuple[bool,
     if json_type not in VALIDATORS:
         return False, [f"Unknown JSON type: {json_type}. Valid types: {list(VALIDATORS.keys())}"]
 
+    if cache is not None:
+        key = cache_key(file_path, json_type, fail_fast)
+        cached = cache.get(key) if key else None
+        if cached is not None:
+            return cached[0], cached[1]
+        is_valid, errors = validate_file(file_path, json_type, stream, fail_fast)
+        if key:
+            cache.put(key, [is_valid, errors])
+        return is_valid, errors
+
+    if stream is None:
+        stream = file_path.stat().st_size >= STREAM_THRESHOLD_BYTES
+
+    if stream:
+        errors = validate_stream(file_path, json_type, fail_fast)
+        return len(errors) == 0, errors
+
+    # Load JSON
+    try:
+        with open(file_path) as f:
+            data = json.load(f)
+    except json.JSONDecodeError as e:
+        return False, [f"Invalid JSON: {e}"]
+
     # Run validation
     validator = VALIDATORS[json_type]
     errors = validator(data)
+    if fail_fast:
+        errors = errors[:1]
 
     return len(errors) == 0, errors
 
 
+def find_json_files(root: Path, json_type: str | None = None) -> list[tuple[Path, str]]:
+    """
+    Find (path, type) for every JSON file under root whose type can be inferred.
+
+    With json_type, only files of that type are returned. Hidden directories
+    (such as .git or cache directories) are not descended into.
+    """
+    found = []
+
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith("."))
+        for filename in sorted(filenames):
+            if not filename.lower().endswith(".json"):
+                continue
+            path = Path(dirpath) / filename
+            file_type = infer_type(path)
+            if file_type is not None and json_type in (None, file_type):
+                found.append((path, file_type))
+
+    return found
+
+
+def validate_tree(root: Path, json_type: str | None = None, jobs: int | None = None,
+                  stream: bool | None = None, fail_fast: bool = False,
+                  cache: ValidationCache | None = None) -> list[tuple[Path, str, bool, list[str]]]:
+    """
+    Validate every inferable JSON file under root across a process pool.
+
+    With fail_fast, validation stops at the first invalid file (in directory
+    order) and only the files up to it are returned. With a cache, workers
+    hash each file and skip validating those whose verdict is cached.
+
+    Returns (path, type, is_valid, errors) per file, in directory order.
+    """
+    files = find_json_files(root, json_type)
+    paths = [path for path, _ in files]
+    types = [file_type for _, file_type in files]
+    jobs = jobs or os.cpu_count() or 1
+    check = partial(validate_uncached, stream=stream, fail_fast=fail_fast)
+    known = cache.keys() if cache is not None else None
+
+    verdicts = []
+
+    def collect(path, file_type, key, verdict) -> bool:
+        """Record one file's verdict; False once fail_fast should stop."""
+        if verdict is not None:
+            if key:
+                cache.put(key, list(verdict))
+        else:
+            cached = cache.get(key)
+            if cached is None:
+                # Evicted by a put since the workers got their key set
+                verdict = validate_file(path, file_type, stream, fail_fast)
+                cache.put(key, list(verdict))
+            else:
+                verdict = (cached[0], cached[1])
+        verdicts.append(verdict)
+        return not (fail_fast and not verdict[0])
+
+    if jobs > 1 and len(files) > 1:
+        # Large chunks amortize inter-process overhead over many small files
+        chunksize = max(1, len(files) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs, initializer=set_known_keys,
+                                 initargs=(known,)) as executor:
+            outcomes = executor.map(check, paths, types, chunksize=chunksize)
+            for path, file_type, (key, verdict) in zip(paths, types, outcomes):
+                if not collect(path, file_type, key, verdict):
+                    executor.shutdown(cancel_futures=True)
+                    break
+    else:
+        set_known_keys(known)
+        try:
+            for path, file_type in files:
+                if not collect(path, file_type, *check(path, file_type)):
+                    break
+        finally:
+            set_known_keys(None)
+
+    results = []
+    for (path, file_type), verdict in zip(files, verdicts):
+        if file_type == "benchmark":
+            # Depends on the rest of the tree, so never cached
+            tree_errors = check_benchmark_tree(path, stream)
+            if tree_errors:
+                verdict = (False, (verdict[1] + tree_errors)[:1] if fail_fast else verdict[1] + tree_errors)
+        results.append((path, file_type, *verdict))
+        if fail_fast and not verdict[0]:
+            break
+    return results
+
+
+def index_runs_dir(runs_dir: Path) -> tuple[set[int], dict[tuple[int, str, int], bool]]:
+    """
+    Index a benchmark's runs/ tree in one pass.
+
+    Returns the eval ids of its eval-N directories and a map of
+    (eval_id, configuration, run_number) -> whether that run directory
+    contains a grading.json, for every eval-N/<configuration>/run-M directory.
+    """
+    eval_ids = set()
+    runs = {}
+
+    for eval_entry in os.scandir(runs_dir):
+        eval_id = run_dir_number(eval_entry, "eval-")
+        if eval_id is None:
+            continue
+        eval_ids.add(eval_id)
+        for config_entry in os.scandir(eval_entry.path):
+            if not config_entry.is_dir():
+                continue
+            for run_entry in os.scandir(config_entry.path):
+                run_number = run_dir_number(run_entry, "run-")
+                if run_number is not None:
+                    has_grading = os.path.isfile(os.path.join(run_entry.path, "grading.json"))
+                    runs[(eval_id, config_entry.name, run_number)] = has_grading
+
+    return eval_ids, runs
+
+
+def run_dir_number(entry: os.DirEntry, prefix: str) -> int | None:
+    """Parse N from an eval-N / run-N directory entry, or None if it isn't one."""
+    if not entry.is_dir() or not entry.name.startswith(prefix):
+        return None
+    try:
+        return int(entry.name[len(prefix):].split("-")[0])
+    except ValueError:
+        return None
+
+
+def loaded_members(document: Any):
+    """iter_members() output for an already-parsed document."""
+    if not isinstance(document, dict):
+        raise ValueError("Top-level value must be an object")
+    for key, value in document.items():
+        if isinstance(value, list):
+            for index, item in enumerate(value):
+                yield key, index, item
+            yield key, None, STREAMED
+        else:
+            yield key, None, value
+
+
+def check_benchmark_tree(benchmark_file: Path, stream: bool | None = None) -> list[str]:
+    """
+    Cross-check a benchmark.json against the runs/ directory beside it.
+
+    Every listed run must have a grading.json on disk, every run directory
+    must have a grading.json that is listed, metadata.evals_run must match
+    the eval-N directories and metadata.runs_per_configuration the number of
+    run directories of each eval and configuration. The tree is indexed once
+    and runs are read in one pass, so this is linear in the number of runs.
+    benchmark.json is streamed under the same rule as validate_file.
+    """
+    runs_dir = benchmark_file.parent / "runs"
+    if not runs_dir.is_dir():
+        return []
+
+    eval_ids, on_disk = index_runs_dir(runs_dir)
+    metadata = {}
+    listed = {}  # (eval_id, configuration, run_number) -> first index in runs
+
+    try:
+        if stream is None:
+            stream = benchmark_file.stat().st_size >= STREAM_THRESHOLD_BYTES
+        with open(benchmark_file) as f:
+            members = iter_members(JSONStreamReader(f)) if stream else loaded_members(json.load(f))
+            for key, index, value in members:
+                if key == "metadata" and isinstance(value, dict):
+                    metadata = value
+                elif key == "runs" and index is not None and isinstance(value, dict):
+                    run_key = (value.get("eval_id"), value.get("configuration"), value.get("run_number"))
+                    listed.setdefault(run_key, index)
+    except (OSError, ValueError):
+        return []  # reported by the schema checks
+
+    errors = []
+    for (eval_id, config, run_number), index in listed.items():
+        if not on_disk.get((eval_id, config, run_number)):
+            errors.append(f"runs[{index}]: no grading.json at runs/eval-{eval_id}/{config}/run-{run_number}")
+
+    for (eval_id, config, run_number), has_grading in sorted(on_disk.items()):
+        run_path = f"runs/eval-{eval_id}/{config}/run-{run_number}"
+        if not has_grading:
+            errors.append(f"{run_path}: run directory has no grading.json")
+        elif (eval_id, config, run_number) not in listed:
+            errors.append(f"{run_path}/grading.json: not included in runs")
+
+    evals_run = metadata.get("evals_run")
+    if isinstance(evals_run, list) and set(evals_run) != eval_ids:
+        errors.append(f"metadata.evals_run {sorted(evals_run, key=str)} does not match "
+                      f"the eval directories {sorted(eval_ids)}")
+
+    runs_per_configuration = metadata.get("runs_per_configuration")
+    if isinstance(runs_per_configuration, int):
+        counts = Counter((eval_id, config) for eval_id, config, _ in on_disk)
+        for (eval_id, config), count in sorted(counts.items()):
+            if count != runs_per_configuration:
+                errors.append(f"metadata.runs_per_configuration is {runs_per_configuration} "
+                              f"but runs/eval-{eval_id}/{config} has {count} run(s)")
+
+    return errors
+
+
+def print_tree_report(root: Path, results: list[tuple[Path, str, bool, list[str]]]) -> None:
+    """Print errors for each invalid file, then a per-type summary."""
+    for path, _, is_valid, errors in results:
+        if not is_valid:
+            print(f"✗ {path.relative_to(root)} has {len(errors)} error(s):")
+            for error in errors:
+                print(f"  - {error}")
+
+    counts = {}
+    for _, file_type, is_valid, _ in results:
+        type_counts = counts.setdefault(file_type, [0, 0])
+        type_counts[0] += 1
+        type_counts[1] += is_valid
+
+    print()
+    print(f"{'Type':<12} {'Files':>7} {'Valid':>7} {'Invalid':>7}")
+    for file_type in sorted(counts):
+        total, valid = counts[file_type]
+        print(f"{file_type:<12} {total:>7} {valid:>7} {total - valid:>7}")
+
+    valid = sum(1 for _, _, is_valid, _ in results if is_valid)
+    mark = "✓" if valid == len(results) else "✗"
+    print(f"\n{mark} {valid} of {len(results)} file(s) in {root} are valid")
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Validate JSON files produced by skill-creator-edge"
     )
-    parser.add_argument("file", type=Path, help="Path to the JSON file to validate")
+    parser.add_argument("file", type=Path,
+                        help="Path to the JSON file to validate, or a directory to validate recursively")
     parser.add_argument(
         "--type", "-t",
         choices=list(VALIDATORS.keys()),
-        help="JSON type (inferred from filename if not specified)"
+        help="JSON type (inferred from filename if not specified; "
+             "for a directory, only files of this type are validated)"
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=None,
+        help="Worker processes for directory validation (default: CPU count)"
+    )
+    parser.add_argument(
+        "--stream",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="Parse incrementally, validating array items as they are read "
+             f"(default: only for files of {STREAM_THRESHOLD_BYTES // (1024 * 1024)} MB or more)"
+    )
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop at the first error (and, for a directory, the first invalid file)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-validate every file instead of reusing verdicts for unchanged content"
     )
 
     args = parser.parse_args()
-
-    is_valid, errors = validate_file(args.file, args.type)
+    cache = None if args.no_cache else ValidationCache(CACHE_NAME)
+
+    if args.file.is_dir():
+        results = validate_tree(args.file, args.type, args.jobs, args.stream, args.fail_fast, cache)
+        if cache is not None:
+            cache.save()
+        if not results:
+            print(f"✗ No JSON files with a recognized name found in {args.file}")
+            sys.exit(1)
+        print_tree_report(args.file, results)
+        if args.fail_fast and not results[-1][2]:
+            print("Stopped at the first invalid file (--fail-fast)")
+        sys.exit(0 if all(is_valid for _, _, is_valid, _ in results) else 1)
+
+    is_valid, errors = validate_file(args.file, args.type, args.stream, args.fail_fast, cache)
+    if cache is not None:
+        cache.save()
+    if (args.type or infer_type(args.file)) == "benchmark" and not (args.fail_fast and errors):
+        errors += check_benchmark_tree(args.file, args.stream)
+        if args.fail_fast:
+            errors = errors[:1]
+        is_valid = not errors
 
     if is_valid:
         print(f"✓ {args.file} is valid")
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Content-hash keyed cache of validation verdicts.
+
+Shared by validate_json.py and quick_validate.py so that re-validating
+unchanged artifacts after every improve iteration skips parsing entirely.
+Entries are keyed by the SHA-256 of the validated file's bytes together with
+a fingerprint of the validator's own source, so editing a schema (or any
+check) invalidates every verdict it produced.
+
+Each validator has its own file, <name>_cache.json in
+$SKILL_CREATOR_CACHE_DIR or ~/.cache/skill-creator (honouring
+$XDG_CACHE_HOME), so loading quick_validate's few verdicts never parses
+validate_json's many. A file keeps the MAX_ENTRIES most recently used
+verdicts.
+"""
+
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from pathlib import Path
+
+
+CACHE_FILENAME = "{name}_cache.json"
+CACHE_VERSION = 1
+MAX_ENTRIES = 10000
+HASH_CHUNK_SIZE = 1 << 20
+
+
+def cache_dir() -> Path:
+    """Return skill-creator's cache directory for this user."""
+    path = os.environ.get("SKILL_CREATOR_CACHE_DIR")
+    if not path:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+        path = Path(base) / "skill-creator"
+    return Path(path)
+
+
+def default_cache_path(name: str) -> Path:
+    """Return the location of a validator's cache file for this user."""
+    return cache_dir() / CACHE_FILENAME.format(name=name)
+
+
+def file_digest(path: Path) -> str | None:
+    """SHA-256 of a file's bytes, or None if it can't be read."""
+    digest = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            while chunk := f.read(HASH_CHUNK_SIZE):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+def source_fingerprint(*paths: str | Path) -> str:
+    """Fingerprint the source files that define a validator's rules."""
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update((file_digest(Path(path)) or "").encode())
+    return digest.hexdigest()[:16]
+
+
+class ValidationCache:
+    """
+    LRU map of cache key -> verdict, persisted as JSON.
+
+    Keys come from key(); verdicts are whatever JSON-serializable value the
+    validator returns (e.g. [is_valid, errors]). Share one instance across a
+    batch of lookups and call save() once at the end. Hits only reorder
+    entries in memory; the new order is persisted by the next save after a
+    put, so a run that only hits never rewrites the file.
+    """
+
+    def __init__(self, name: str, path: Path | None = None, max_entries: int = MAX_ENTRIES):
+        self.path = path or default_cache_path(name)
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.changed = False
+
+        try:
+            with open(self.path) as f:
+                cache = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return
+        if isinstance(cache, dict) and cache.get("version") == CACHE_VERSION:
+            # Stored oldest first
+            self.entries.update(cache.get("entries", []))
+
+    @staticmethod
+    def key(validator: str, fingerprint: str, digest: str, *options) -> str:
+        """Build a cache key for one file under one validator configuration."""
+        return ":".join([validator, fingerprint, digest, *map(str, options)])
+
+    def get(self, key: str):
+        """Return the cached verdict for key (marking it recently used), or None."""
+        verdict = self.entries.get(key)
+        if verdict is not None:
+            self.entries.move_to_end(key)
+        return verdict
+
+    def keys(self) -> frozenset:
+        """Keys with a cached verdict, for workers deciding what to skip."""
+        return frozenset(self.entries)
+
+    def put(self, key: str, verdict) -> None:
+        """Store a verdict, evicting the least recently used beyond max_entries."""
+        self.entries[key] = verdict
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        self.changed = True
+
+    def save(self) -> None:
+        """Write the cache atomically if anything changed."""
+        if not self.changed:
+            return
+        tmp_file = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_file, "w") as f:
+                json.dump({"version": CACHE_VERSION, "entries": list(self.entries.items())},
+                          f, separators=(",", ":"))
+            tmp_file.replace(self.path)
+            self.changed = False
+        except OSError as e:
+            print(f"Warning: Could not write validation cache {self.path}: {e}")